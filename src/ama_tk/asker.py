@@ -13,43 +13,22 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import os.path
 import sys
+import time
 import tkinter as tk
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from io import TextIOWrapper
-from tkinter import font, ttk
+from tkinter import ttk
 from typing import Any
 
-import ama.validator
-import click
-import tks.color_funcs
 from ama.asker import Asker
-from ama.hook.impl import hookimpl
 from ama.types import Answers, Question, Result
-from tks.colors import ColorEntry, ColorVar
-from tks.dates import DateEntry, DateVar
-from tks.fs import DirEntry
-from tks.icon import set_icon_from_file, set_icon_from_resource
-from tks.passwords import PasswordEntry
-from tks.times import TimeEntry, TimeVar
-from tks.tooltip import ToolTip
 
-
-@hookimpl  # type: ignore
-def ama_asker_class():
-    return TkAsker
-
-
-@hookimpl  # type: ignore
-def ama_asker_addoption(command: click.Command) -> click.Command:
-    option = click.option(
-        "-i",
-        "--invalid",
-        "allow_invalid",
-        is_flag=True,
-        default=False,
-        help="Return answers even if they don't validate",
-    )
-    return option(command)
+import ama_tk.validator
+from ama_tk.depends import DependencyIndex
+from ama_tk.question import QuestionState
+from ama_tk.scheduler import KeystrokeScheduler
+from ama_tk.styles import HEADER_LABEL, INFO_LABEL, QUESTION_LABEL, styles_for
+from ama_tk.virtual import VirtualForm, VirtualQuestion
 
 
 class TkAsker(Asker):
@@ -65,13 +44,58 @@ class TkAsker(Asker):
                           If False then you can't close the window until
                           all answers are valid.
     :type allow_invalid:  bool
+    :param virtual: If True display the questions in a scrolling form which
+                    only creates widgets for the visible questions. See
+                    :mod:`ama_tk.virtual`
+    :type virtual:  bool
+    :param lazy_widgets: If True the date, time, color and path entry widgets
+                         and help tooltips are only created when the pointer
+                         is moved over them or they receive the focus.
+    :type lazy_widgets:  bool
+    :param debounce: The time in milliseconds to wait after a key is pressed
+                     before updating the answers which depend on the edited
+                     answer. If 0 (the default) the updates are made when Tk
+                     is next idle. Pending updates are always made when an
+                     entry loses the focus and when OK is pressed.
+    :type debounce:  int
+    :param progressive: If True the window is displayed as soon as the first
+                        screenful of questions has been created and the rest
+                        are created in the background. OK is disabled until
+                        every question has been created. Ignored in virtual
+                        mode, which doesn't need it.
+    :type progressive:  bool
     """
 
+    # The estimated height of a question's row in pixels, used to work out
+    # how many questions fill the screen
+    ROW_HEIGHT = 25
+
+    # The time in seconds to spend creating questions before letting Tk
+    # process events when creating questions progressively
+    CHUNK_TIME = 0.03
+
     def __init__(self, data: TextIOWrapper | str | None = None, **kwargs: Any):
         Asker.__init__(self, data)
         self._allow_invalid = kwargs.get("allow_invalid", False)
+        self._virtual = kwargs.get("virtual", False)
+        self._lazy_widgets = kwargs.get("lazy_widgets", False)
+        self._progressive = kwargs.get("progressive", False) and not self._virtual
+        self._form = None
         self._create_root()
+        self._scheduler = KeystrokeScheduler(
+            self._root, self._update_answers, kwargs.get("debounce", 0)
+        )
         self._ask: dict[str, Question] = {}
+        self._tab_order: dict[str, int] = {}
+        self._invalid: set[str] = set()
+        self._depends: DependencyIndex | None = None
+
+        # The questions waiting to be created when building progressively
+        self._queued: deque[Question] = deque()
+        self._resolved: set[str] = set()
+        self._building = False
+        self._build_id = None
+        self._progress = None
 
         self._row = 0
         self._working_directory = os.getcwd()
@@ -83,7 +107,20 @@ class TkAsker(Asker):
         Called by the :meth:`Asker.ask` method or by your code.
         """
 
-        tkq = TkQuestion(self, self._row, question)
+        if self._progressive:
+            self._queued.append(question)
+            return
+
+        self._create_question(question)
+        self._depends = None
+
+    def _create_question(self, question: Question) -> None:
+        self._tab_order[question["name"]] = self._row
+
+        if self._virtual:
+            tkq = VirtualQuestion(self, self._row, question)
+        else:
+            tkq = TkQuestion(self, self._row, question)
         self._ask[question["name"]] = tkq
         self._row = self._row + 1
 
@@ -91,12 +128,110 @@ class TkAsker(Asker):
         """Perform the question asking by displaying in a Tkinter window"""
 
         self._result = {}
-        self._update_answers()
+        if self._queued:
+            self._start_build()
+        else:
+            self.resolve_defaults()
+            if self._virtual:
+                self._create_form()
         self._root.update_idletasks()
         self._root.minsize(self._root.winfo_reqwidth(), self._root.winfo_reqheight())
         self._root.mainloop()
         return self._result
 
+    def resolve_defaults(self):
+        """Set the value of every unedited question from its default.
+
+        Questions are created without reading the other answers so the
+        defaults which refer to other answers are filled in by this single
+        pass, in dependency order, once all the questions have been added.
+
+        :raises ValueError: If the defaults refer to each other in a cycle.
+        """
+
+        self._depends = None
+        self._update_answers()
+
+    def _start_build(self):
+        """Create the first screenful of questions and schedule creating the
+        rest in chunks.
+
+        :raises ValueError: If the defaults refer to each other in a cycle.
+        """
+
+        self._depends = DependencyIndex(
+            {
+                question["name"]: question.get("default", None)
+                for question in self._queued
+            }
+        )
+        self._resolved = set()
+        self._building = True
+        self.ok_btn.state(["disabled"])
+
+        self._progress = ttk.Progressbar(
+            self._buttons, mode="determinate", maximum=len(self._queued)
+        )
+        self._progress.grid(column=0, row=0, sticky=tk.EW, padx=(0, 6))
+
+        rows = max(1, self._root.winfo_screenheight() // self.ROW_HEIGHT)
+        for _idx in range(min(rows, len(self._queued))):
+            self._build_next()
+
+        # A timer rather than an idle callback so that the update_idletasks
+        # in run() doesn't create every question before the window is shown
+        self._build_id = self._root.after(1, self._build_chunk)
+
+    def _build_next(self):
+        question = self._queued.popleft()
+        self._create_question(question)
+        self._resolve_ready(question["name"])
+
+    def _build_chunk(self):
+        """Create questions until the time for a chunk has been used."""
+
+        deadline = time.perf_counter() + self.CHUNK_TIME
+        while self._queued and time.perf_counter() < deadline:
+            self._build_next()
+
+        self._progress["value"] = len(self._ask)
+
+        if self._queued:
+            self._build_id = self._root.after(1, self._build_chunk)
+        else:
+            self._build_id = None
+            self._finish_build()
+
+    def _finish_build(self):
+        self._building = False
+        self._progress.destroy()
+        self._progress = None
+        self.check_invalid()
+
+    def _resolve_ready(self, key):
+        """Set the value of a newly created question from its default once
+        all the questions its default refers to have been created, then do
+        the same for the questions which depend on it.
+        """
+
+        depends = self._depends
+        keys = [key]
+        while keys:
+            key = keys.pop()
+            if key in self._resolved or key not in self._ask:
+                continue
+
+            dependencies = depends.dependencies[key]
+            if any(dependency not in self._resolved for dependency in dependencies):
+                continue
+
+            tkq = self._ask[key]
+            if not tkq.edited:
+                tkq.update({dep: self._ask[dep].value for dep in dependencies})
+
+            self._resolved.add(key)
+            keys.extend(depends.dependents[key])
+
     def current_answers(self, update_info=None):
         """Return a dictionary of the current answers to the questions.
 
@@ -114,29 +249,93 @@ class TkAsker(Asker):
 
         return current_answers
 
+    def _dependency_index(self) -> DependencyIndex:
+        """Return the index of which questions' defaults refer to the answers
+        to other questions.
+
+        :raises ValueError: If the defaults refer to each other in a cycle.
+        """
+
+        if self._depends is None:
+            self._depends = DependencyIndex(
+                {key: tkq.default for key, tkq in self._ask.items()}
+            )
+
+        return self._depends
+
     def _update_answers(self, update_info=None):
-        """Update all unedited answers with the values from the other answers"""
+        """Update unedited answers with the values from the other answers.
 
-        answers = self.current_answers(update_info)
+        If `update_info` is None all the answers are updated otherwise only
+        the answers which depend on the changed answer are updated. Answers
+        are updated in dependency order and each question is only passed
+        the answers its default refers to.
+        """
 
-        for key, tkq in self._ask.items():
-            if (update_info is None or key != update_info[0]) and (
-                not tkq.edited or key == update_info[0]
-            ):
-                tkq.update(answers)
+        depends = self._dependency_index()
+
+        if update_info is None:
+            keys = depends.order
+            answers = {}
+        else:
+            changed, value = update_info
+            keys = depends.affected(changed)
+            answers = {changed: value}
+
+        for key in keys:
+            tkq = self._ask.get(key, None)
+            if tkq is None or tkq.edited:
+                continue
+
+            # Questions still to be created are updated when they're created
+            if self._building and key not in self._resolved:
+                continue
+
+            for dependency in depends.dependencies[key]:
+                if dependency not in answers:
+                    answers[dependency] = self._ask[dependency].value
+
+            tkq.update(answers)
+            answers[key] = tkq.value
+
+    def answer_changed(self, key, value):
+        """Schedule updating the answers which depend on a changed answer."""
+
+        self._scheduler.schedule(key, value)
+
+    def flush_changes(self):
+        """Make any pending updates to the answers now."""
+
+        self._scheduler.flush()
+
+    def validity_changed(self, key, valid):
+        """Record that a question's answer has become valid or invalid.
+
+        Called by the questions whenever their validity changes.
+        """
+
+        if valid:
+            self._invalid.discard(key)
+        else:
+            self._invalid.add(key)
+
+    def invalid_fields(self):
+        """Return the keys of the questions with invalid answers in the order
+        they're displayed.
+        """
+
+        return sorted(self._invalid, key=self._tab_order.__getitem__)
 
     def check_invalid(self):
         """If we don't allow invalid answers then disable the OK button if
         we have any.
         """
 
-        if not self._allow_invalid and not self._is_valid():
+        if self._building or (not self._allow_invalid and self._invalid):
             self.ok_btn.state(["disabled"])
         else:
             self.ok_btn.state(["!disabled"])
 
-        self.ok_btn.update_idletasks()
-
     def _create_root(self):
         self._root = tk.Tk()
         title = self.question_data["title"]
@@ -144,12 +343,13 @@ class TkAsker(Asker):
 
         self._root.title(title)
 
+        from tks.icon import set_icon_from_resource
+
         set_icon_from_resource(self._root, "ama", "icon.gif")
 
-        f = font.Font(font=("TkHeadingFont", 0, font.BOLD))
-        ttk.Style().configure("header.TLabel", font=f)
+        self.styles = styles_for(self._root)
 
-        header = ttk.Label(self._root, text=preamble, padding=3, style="header.TLabel")
+        header = ttk.Label(self._root, text=preamble, padding=3, style=HEADER_LABEL)
         header.grid(column=0, row=0, sticky=(tk.N, tk.EW))
 
         self.content_frame = ttk.Frame(self._root, padding=(3, 3, 3, 3))
@@ -162,6 +362,7 @@ class TkAsker(Asker):
         self._root.rowconfigure(0, weight=0)
 
         okcancel = ttk.Frame(self._root, padding=(3, 3, 3, 3))
+        self._buttons = okcancel
 
         # Swap the order of buttons for Windows
         if sys.platform.startswith("win32"):
@@ -186,19 +387,26 @@ class TkAsker(Asker):
         if sys.platform.startswith("darwin"):
             self._root.createcommand("::tk::mac::Quit", self._cancel)
 
+    def _create_form(self):
+        """Create the scrolling form used in virtual mode."""
+
+        self._form = VirtualForm(self.content_frame, list(self._ask.values()))
+        self._form.grid(column=0, row=0, columnspan=3, sticky=(tk.N, tk.S, tk.E, tk.W))
+        self.content_frame.rowconfigure(0, weight=1)
+        self._root.rowconfigure(1, weight=1)
+        self._root.rowconfigure(2, weight=0)
+
     def _is_valid(self):
         """Check if all the answers are valid."""
 
-        for _key, question in self._ask.items():
-            if not question.valid:
-                return False
-
-        return True
+        return not self._invalid
 
     # pylint: disable=unused-argument
     def _ok(self, event=None):
         """Respond to the OK button being pressed."""
 
+        self.flush_changes()
+
         self._result["valid"] = self._is_valid()
         self._result["result"] = "ok"
 
@@ -216,49 +424,48 @@ class TkAsker(Asker):
 
         self._result["valid"] = False
         self._result["result"] = "cancel"
+        self._scheduler.cancel()
+        if self._build_id is not None:
+            self._root.after_cancel(self._build_id)
         self._root.destroy()
 
 
-class TkQuestion(object):
+class TkQuestion(QuestionState):
     """Displays the controls for a single question."""
 
+    # The types displayed by composite widgets from tks, which are replaced
+    # by a placeholder until they're used when widgets are created lazily.
+    _composites = ("path", "date", "time", "color")
+
     def __init__(self, asker, row, question: Question):
-        self._asker = asker
+        super(TkQuestion, self).__init__(asker, question)
         self._row = row
 
-        self._key = question["name"]
-        self._label = question["message"]
-        self._default = question.get("default", None)
-        self._validator = question["type"]
-        self._spec = question.get("format", None)
-
-        if self._spec and self._spec.startswith("path"):
-            self._default = os.path.normpath(self._default)
-
-        self._dont_update = ["bool", "yesno", "date", "time", "color", "password"]
-
         self._tkvar = None
         self._entry = None
+        self._placeholder = None
 
-        self._is_edited = False
-        self._is_valid = True
-
-        f = font.Font(font=("TkTextFont",))
-        ttk.Style().configure("question.TLabel", font=f)
+        self._styles = asker.styles
 
         self.label = ttk.Label(
-            asker.content_frame, text=self._label, style="question.TLabel"
+            asker.content_frame, text=self.message, style=QUESTION_LABEL
         )
         self.label.grid(column=0, row=self._row, sticky=(tk.N, tk.S, tk.W), padx=(0, 5))
 
-        ttk.Style().configure("error.TLabel", font=f)
-        self._info_label = ttk.Label(asker.content_frame, width=2, anchor=tk.CENTER)
+        self._info_label = ttk.Label(
+            asker.content_frame, width=2, anchor=tk.CENTER, style=INFO_LABEL
+        )
         self._info_label.grid(column=2, row=self._row, padx=(3, 0))
 
-        self._help_text = question.get("help", "")
-        if self._help_text != "":
+        if self.help_text != "":
             self._info_label["text"] = "?"
-            ToolTip(self._info_label, msg=self._help_text, delay=0.5)
+
+            if asker._lazy_widgets:
+                self._tooltip_binding = self._info_label.bind(
+                    "<Enter>", self._create_tooltip
+                )
+            else:
+                self._create_tooltip()
 
         self._validate_entry = (
             asker._root.register(self._tk_validate_entry),
@@ -266,51 +473,21 @@ class TkQuestion(object):
             "%V",
         )
 
-        current_answers = self._asker.current_answers()
-
-        if self._validator == "path":
-            self._tkvar = tk.StringVar()
-            self._entry = DirEntry(asker.content_frame, variable=self._tkvar)
-            frame = self._entry
-
-        elif self._validator == "date":
-            self._tkvar = DateVar()
-            self._entry = DateEntry(asker.content_frame, variable=self._tkvar)
-            frame = self._entry
-
-        elif self._validator == "time":
-            self._tkvar = TimeVar()
-            self._entry = TimeEntry(asker.content_frame, variable=self._tkvar)
-            frame = self._entry
-
-        elif self._validator == "color":
-            if self._spec:
-                color_format = self._spec
+        if self.type in self._composites:
+            self._create_variable()
+            if asker._lazy_widgets:
+                frame = self._create_placeholder()
             else:
-                color_format = "rgbhex"
-
-            self._tkvar = ColorVar()
-            if self._default:
-                if self._spec == "rgbhex":
-                    color = tks.color_funcs.hex_string_to_rgb(self._default, True)
-                else:
-                    color = tks.color_funcs.color_string_to_rgb(self._default)
+                frame = self._create_composite()
 
-            self._tkvar.set(color)
+        elif self.type == "password":
+            from tks.passwords import PasswordEntry
 
-            self._entry = ColorEntry(
-                asker.content_frame, variable=self._tkvar, color_format=color_format
-            )
-
-            self._spec = "rgb"
-            frame = self._entry
-
-        elif self._validator == "password":
             self._tkvar = tk.StringVar()
             self._entry = PasswordEntry(asker.content_frame, variable=self._tkvar)
             frame = self._entry
 
-        elif self._validator == "str":
+        elif self.type == "str":
             self._tkvar = tk.StringVar()
             self._entry = ttk.Entry(
                 asker.content_frame,
@@ -320,7 +497,7 @@ class TkQuestion(object):
             )
             frame = self._entry
 
-        elif self._validator == "int" or isinstance(self._validator, int):
+        elif self.type == "int" or isinstance(self.type, int):
             self._tkvar = tk.IntVar()
             self._entry = ttk.Entry(
                 asker.content_frame,
@@ -331,7 +508,7 @@ class TkQuestion(object):
             self._entry.configure(width=30)
             frame = self._entry
 
-        elif self._validator == "float" or isinstance(self._validator, float):
+        elif self.type == "float" or isinstance(self.type, float):
             self._tkvar = tk.DoubleVar()
             self._entry = ttk.Entry(
                 asker.content_frame,
@@ -343,15 +520,14 @@ class TkQuestion(object):
             frame = self._entry
 
         elif (
-            self._validator == "bool"
-            or self._validator == "yesno"
-            or isinstance(self._validator, bool)
+            self.type == "bool"
+            or self.type == "yesno"
+            or isinstance(self.type, bool)
         ):
             self._tkvar = tk.BooleanVar()
-            self._tkvar.set(self._default or False)
             frame = ttk.Frame(asker.content_frame)
 
-            if self._validator == "yesno":
+            if self.type == "yesno":
                 text = ("Yes", "No")
             else:
                 text = ("True", "False")
@@ -362,12 +538,11 @@ class TkQuestion(object):
             n = ttk.Radiobutton(frame, text=text[1], variable=self._tkvar, value=False)
             n.grid(column=1, row=0)
 
-        elif isinstance(self._validator, list):
+        elif isinstance(self.type, list):
             self._tkvar = tk.StringVar()
-            self.value = self._validator[0]
-            if len(self._validator) <= 3:
+            if len(self.type) <= 3:
                 frame = ttk.Frame(asker.content_frame)
-                for idx, e in enumerate(self._validator):
+                for idx, e in enumerate(self.type):
                     rb = ttk.Radiobutton(
                         frame, text=str(e), variable=self._tkvar, value=str(e)
                     )
@@ -376,7 +551,7 @@ class TkQuestion(object):
                 self._entry = ttk.Combobox(
                     asker.content_frame, textvariable=self._tkvar
                 )
-                self._entry["values"] = tuple(self._validator)
+                self._entry["values"] = tuple(self.type)
                 frame = self._entry
 
         else:
@@ -389,94 +564,201 @@ class TkQuestion(object):
         asker.content_frame.rowconfigure(self._row, weight=1)
         self.edited = False
 
-        self._validate = ama.validator.get_validator(self._validator, self._spec)
+        self._tkvar.trace_add("write", self._invalidate_value)
+        self._set_initial_value()
 
-        if self._validator not in self._dont_update:
-            self.update(current_answers)
+    def _set_initial_value(self):
+        # The color variable is set from the default when it's created
+        if self.type != "color":
+            super(TkQuestion, self)._set_initial_value()
 
-    def update(self, current_answers):
-        """Update our unedited value with the other answers."""
+    def _create_variable(self):
+        """Create the Tk variable for a type displayed by a composite widget."""
 
-        if not self.edited and self._validator not in self._dont_update:
-            _current_answers = {
-                k: v for k, v in current_answers.items() if v is not None
-            }
+        if self.type == "path":
+            self._tkvar = tk.StringVar()
 
-            if self._validator == "str" and self._default is None:
-                self._default = ""
-            updated_answer = str(self._default).format(**_current_answers)
-            self.value = updated_answer
+        elif self.type == "date":
+            from tks.dates import DateVar
 
-    @property
-    def value(self):
-        if self.valid:
-            return self._validate(self._tkvar.get())
-        else:
+            self._tkvar = DateVar()
+
+        elif self.type == "time":
+            from tks.times import TimeVar
+
+            self._tkvar = TimeVar()
+
+        elif self.type == "color":
+            import tks.color_funcs
+            from tks.colors import ColorVar
+
+            if self._spec:
+                self._color_format = self._spec
+            else:
+                self._color_format = "rgbhex"
+
+            self._tkvar = ColorVar()
+            if self._default:
+                if self._spec == "rgbhex":
+                    color = tks.color_funcs.hex_string_to_rgb(self._default, True)
+                else:
+                    color = tks.color_funcs.color_string_to_rgb(self._default)
+
+            self._tkvar.set(color)
+            self._spec = "rgb"
+            self._validate = ama_tk.validator.get_validator(self._validator, self._spec)
+
+    def _create_composite(self):
+        """Create the composite widget for the question's variable."""
+
+        master = self._asker.content_frame
+
+        if self.type == "path":
+            from tks.fs import DirEntry
+
+            self._entry = DirEntry(master, variable=self._tkvar)
+
+        elif self.type == "date":
+            from tks.dates import DateEntry
+
+            self._entry = DateEntry(master, variable=self._tkvar)
+
+        elif self.type == "time":
+            from tks.times import TimeEntry
+
+            self._entry = TimeEntry(master, variable=self._tkvar)
+
+        elif self.type == "color":
+            from tks.colors import ColorEntry
+
+            self._entry = ColorEntry(
+                master, variable=self._tkvar, color_format=self._color_format
+            )
+
+        return self._entry
+
+    def _create_placeholder(self):
+        """Create an entry to display the value until the composite widget
+        is needed.
+        """
+
+        self._placeholder_var = tk.StringVar(value=self._placeholder_text())
+        self._placeholder_trace = self._tkvar.trace_add(
+            "write", self._update_placeholder
+        )
+
+        self._placeholder = ttk.Entry(
+            self._asker.content_frame,
+            textvariable=self._placeholder_var,
+            state="readonly",
+        )
+        self._placeholder.bind("<Enter>", lambda event: self._replace_placeholder())
+        self._placeholder.bind(
+            "<FocusIn>", lambda event: self._replace_placeholder(focus=True)
+        )
+        self._placeholder.bind(
+            "<Button-1>", lambda event: self._replace_placeholder(focus=True)
+        )
+
+        return self._placeholder
+
+    def _placeholder_text(self):
+        try:
+            value = self._tkvar.get()
+        except (tk.TclError, TypeError, ValueError):
+            return ""
+
+        if value is None:
             return ""
+        elif self.type == "color" and isinstance(value, (tuple, list)):
+            return "rgb(%s)" % ", ".join(str(c) for c in value)
+        elif hasattr(value, "strftime"):
+            if self._spec:
+                return value.strftime(self._spec)
+            elif self.type == "date":
+                return value.strftime(ama_tk.validator.DEFAULT_DATE_FORMAT)
+            else:
+                return value.strftime(ama_tk.validator.DEFAULT_TIME_FORMAT)
+        else:
+            return str(value)
+
+    def _update_placeholder(self, *args):
+        self._placeholder_var.set(self._placeholder_text())
+
+    def _replace_placeholder(self, focus=False):
+        """Replace the placeholder with the composite widget. The value is
+        kept in the question's variable so nothing else changes.
+        """
+
+        placeholder = self._placeholder
+        if placeholder is None:
+            return "break"
+
+        self._placeholder = None
+        self._tkvar.trace_remove("write", self._placeholder_trace)
+
+        widget = self._create_composite()
+        widget.grid(column=1, row=self._row, sticky=tk.EW, padx=0)
+        placeholder.grid_remove()
+        placeholder.after_idle(placeholder.destroy)
+
+        if focus:
+            self._focus_first_entry(widget)
+
+        return "break"
+
+    @staticmethod
+    def _focus_first_entry(widget):
+        widgets = [widget]
+        while widgets:
+            w = widgets.pop(0)
+            if isinstance(w, tk.Entry):
+                w.focus_set()
+                return
+            widgets.extend(w.winfo_children())
+
+        widget.focus_set()
 
-    @value.setter
-    def value(self, value):
+    def _create_tooltip(self, event=None):
+        from tks.tooltip import ToolTip
+
+        if event is not None:
+            self._info_label.unbind("<Enter>", self._tooltip_binding)
+
+        ToolTip(self._info_label, msg=self.help_text, delay=0.5)
+
+        if event is not None:
+            # Show the tooltip for the event which created it
+            self._info_label.event_generate("<Enter>", x=event.x, y=event.y)
+
+    def _read(self):
         try:
-            value = self._validate(value)
-            self._tkvar.set(value)
-            self.valid = True
-        except (TypeError, ValueError):
-            self._tkvar.set(value)
-            self.valid = False
-
-    @property
-    def valid(self):
-        return self._is_valid
-
-    @valid.setter
-    def valid(self, value):
-        self._is_valid = bool(value)
+            return self._tkvar.get()
+        except tk.TclError as exc:
+            raise ValueError(str(exc))
+
+    def _write(self, value, validated, valid):
+        self._tkvar.set(validated if valid else value)
+
+    def _show_valid(self):
         if self._is_valid:
-            if self._help_text != "":
-                self._info_label["text"] = "?"
-            self._info_label["background"] = ""
+            self._info_label["text"] = "?" if self.help_text != "" else ""
         else:
             self._info_label["text"] = "!"
-            self._info_label["background"] = "#e00"
-
-    @property
-    def edited(self):
-        return self._is_edited
-
-    @edited.setter
-    def edited(self, value):
-        self._is_edited = bool(value)
+        self._info_label["style"] = self._styles.info_style(self._is_valid)
 
+    def _show_edited(self):
         if isinstance(self._entry, ttk.Entry):
-            if self._is_edited:
-                self._entry["style"] = "TEntry"
-            else:
-                self._entry["style"] = "unedited.TEntry"
+            self._entry["style"] = self._styles.entry_style(self._is_edited)
 
     def _tk_validate_entry(self, P, V):
         # pylint: disable=invalid-name
         rtn = 1
         if V == "focusout":
-            if self._spec == "nonempty" and not P:
-                self.valid = False
-                self.edited = True
-            elif P.strip() == "":
-                self.valid = True
-                self.edited = False
-            else:
-                try:
-                    _value = self._validate(P)
-                    self.valid = True
-                except (ValueError, TypeError):
-                    self.valid = False
-                    rtn = 0
-
-            self._asker.check_invalid()
+            if not self.check(P):
+                rtn = 0
         elif V == "key":
-            if not self.edited:
-                self.edited = True
-
-            self._asker._update_answers((self._key, P))
+            self.edit(P)
 
         return rtn
 
@@ -0,0 +1,218 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Validate whole columns of values in a single call.
+
+:func:`validate_many` accepts a list, any other iterable or a NumPy array and
+returns a :class:`ValidationResult` containing the validated values, a mask
+which is True for each value that failed validation and the error messages.
+
+NumPy arrays passed to the ``int``, ``float``, ``number``, ``bool`` and
+``yesno`` validators are converted and range checked with array operations.
+Only the values the array operations cannot accept are passed to the scalar
+validator, which also produces their error messages, so the results are the
+same as validating each value in turn. NumPy is never imported by this module;
+the vectorized path is only used when an array is passed in.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import sys
+from collections import namedtuple
+
+from ama_tk.spec import compile_spec
+from ama_tk.validator import Bool, Float, Int, Number, get_validator, validators
+
+ValidationResult = namedtuple('ValidationResult', 'values mask messages')
+
+# Index ranges smaller than this which fail to convert as a block are left to
+# the scalar validator rather than being split further.
+_SPLIT_LIMIT = 16
+
+
+def validate_many(validator, spec, values):
+    """Validate a sequence of values with the same validator.
+
+    :param validator: The name of the validator to use
+    :type validator:  str
+    :param spec: A specification to modify how the validator works
+    :type spec:  str
+    :param values: The values to validate; a list, an iterable or a NumPy
+                   array.
+    :returns: A :class:`ValidationResult`. For NumPy input the values, mask
+              and messages are arrays, otherwise they are lists. The value is
+              None (or zero/NaN/False for typed arrays) and the message is
+              the validation error for each invalid entry.
+    """
+
+    func = get_validator(validator, spec)
+
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(values, np.ndarray):
+        if values.ndim != 1:
+            raise ValueError('Only 1 dimensional arrays can be validated')
+
+        kernel = None
+        if isinstance(validator, str):
+            kernel = _kernels.get(validators.get(validator, None), None)
+
+        if kernel is not None:
+            return kernel(np, func, compile_spec(spec), values)
+        else:
+            return _validate_array(np, func, values)
+
+    return _validate_iterable(func, values)
+
+
+def _validate_iterable(func, values):
+    out = []
+    mask = []
+    messages = []
+
+    append_value = out.append
+    append_mask = mask.append
+    append_message = messages.append
+
+    for value in values:
+        try:
+            append_value(func(value))
+            append_mask(False)
+            append_message(None)
+        except (TypeError, ValueError) as exc:
+            append_value(None)
+            append_mask(True)
+            append_message(str(exc))
+
+    return ValidationResult(out, mask, messages)
+
+
+def _validate_array(np, func, values):
+    result = _validate_iterable(func, values.tolist())
+    return ValidationResult(np.array(result.values, dtype=object),
+                            np.array(result.mask, dtype=bool),
+                            np.array(result.messages, dtype=object))
+
+
+def _convert(np, values, dtype, out, ok, idx):
+    """Convert ``values[idx]`` to `dtype` as a block, splitting the block in
+    two whenever it contains a value which fails to convert.
+    """
+
+    try:
+        out[idx] = values[idx].astype(dtype)
+        ok[idx] = True
+    except (TypeError, ValueError, OverflowError):
+        if len(idx) > _SPLIT_LIMIT:
+            mid = len(idx) // 2
+            _convert(np, values, dtype, out, ok, idx[:mid])
+            _convert(np, values, dtype, out, ok, idx[mid:])
+
+
+def _check_bounds(np, spec, conv, out, ok):
+    if 'min' in spec.kwargs:
+        ok &= out >= conv(spec.kwargs['min'])
+
+    if 'max' in spec.kwargs:
+        ok &= out <= conv(spec.kwargs['max'])
+
+
+def _finish(np, func, values, out, ok):
+    """Pass every value that wasn't accepted by the array operations to the
+    scalar validator.
+    """
+
+    mask = np.zeros(len(values), dtype=bool)
+    messages = np.full(len(values), None, dtype=object)
+
+    idx = np.flatnonzero(~ok)
+    if len(idx):
+        for i, value in zip(idx.tolist(), values[idx].tolist()):
+            try:
+                value = func(value)
+            except (TypeError, ValueError) as exc:
+                mask[i] = True
+                messages[i] = str(exc)
+                continue
+
+            try:
+                out[i] = value
+            except OverflowError:
+                out = out.astype(object)
+                out[i] = value
+
+    return ValidationResult(out, mask, messages)
+
+
+def _int_kernel(np, func, spec, values):
+    kind = values.dtype.kind
+    out = np.zeros(len(values), dtype=np.int64)
+    ok = np.zeros(len(values), dtype=bool)
+
+    if kind in 'bi' or (kind == 'u' and values.dtype.itemsize < 8):
+        _convert(np, values, np.int64, out, ok, np.arange(len(values)))
+    elif kind == 'U' and str(spec.get('decimal', '.')) == '.':
+        _convert(np, values, np.int64, out, ok, np.arange(len(values)))
+    elif kind != 'f':
+        return _validate_array(np, func, values)
+
+    _check_bounds(np, spec, int, out, ok)
+    return _finish(np, func, values, out, ok)
+
+
+def _float_kernel(np, func, spec, values, nocoerce=False):
+    kind = values.dtype.kind
+    out = np.zeros(len(values), dtype=np.float64)
+    ok = np.zeros(len(values), dtype=bool)
+
+    if kind == 'f' or (kind in 'biu' and not nocoerce):
+        _convert(np, values, np.float64, out, ok, np.arange(len(values)))
+    elif kind == 'U':
+        decimal = str(spec.get('decimal', '.'))
+        strings = values
+        if decimal != '.':
+            strings = np.char.replace(values, decimal, '.')
+
+        if nocoerce:
+            idx = np.flatnonzero(np.char.find(values, decimal) >= 0)
+        else:
+            idx = np.arange(len(values))
+
+        _convert(np, strings, np.float64, out, ok, idx)
+    elif kind not in 'biu':
+        return _validate_array(np, func, values)
+
+    _check_bounds(np, spec, float, out, ok)
+    out[~ok] = np.nan
+    return _finish(np, func, values, out, ok)
+
+
+def _float_nocoerce_kernel(np, func, spec, values):
+    return _float_kernel(np, func, spec, values, nocoerce='nocoerce' in spec.kwargs)
+
+
+def _bool_kernel(np, func, spec, values):
+    kind = values.dtype.kind
+
+    if kind == 'b':
+        out = values.copy()
+        ok = np.ones(len(values), dtype=bool)
+    elif kind in 'iu':
+        out = values != 0
+        ok = np.ones(len(values), dtype=bool)
+    elif kind == 'U':
+        lower = np.char.lower(values)
+        out = np.isin(lower, ['true', '1', 'yes', 'y'])
+        ok = out | np.isin(lower, ['false', '0', 'no', 'n'])
+    else:
+        return _validate_array(np, func, values)
+
+    return _finish(np, func, values, out, ok)
+
+
+# Keyed on the factory so that a validator which has been overridden in the
+# registry is never replaced by a kernel for the built in one.
+_kernels = {
+    Int: _int_kernel,
+    Float: _float_nocoerce_kernel,
+    Number: _float_kernel,
+    Bool: _bool_kernel,
+}
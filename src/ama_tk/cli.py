@@ -0,0 +1,225 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Validate answer documents against a question file without a display.
+
+The questions are compiled into a :class:`~ama_tk.plan.ValidationPlan` once
+in each worker process and the answer documents are validated in parallel.
+Answers are read either from a directory of ``.json`` files or from a file
+of JSON lines, with ``-`` for standard input ::
+
+    ama-tk-validate questions.json answers/
+    ama-tk-validate questions.json answers.jsonl
+    generate-answers | ama-tk-validate questions.json -
+
+A JSON line is written for each document, in the order they're read, as the
+documents are validated. Every line has the same keys; ``errors`` maps the
+names of the invalid answers to their messages and ``error`` is the reason a
+document couldn't be read, or null ::
+
+    {"source": "answers/a.json", "valid": false, "errors": {"port": "..."}, "error": null}
+    {"source": "answers.jsonl:3", "valid": false, "errors": {}, "error": "Expecting value: ..."}
+
+The exit status is 1 if any document is invalid.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import click
+
+from ama_tk.plan import ValidationPlan
+
+_plan = None
+_require_all = False
+
+
+def load_questions(filename):
+    """Load the questions from a question file, either a list of questions
+    or an object with a ``questions`` list.
+    """
+
+    with open(filename) as fp:
+        data = json.load(fp)
+
+    if isinstance(data, dict):
+        data = data.get("questions", None)
+
+    if not isinstance(data, list):
+        raise ValueError("%s does not contain a list of questions" % filename)
+
+    return data
+
+
+def read_directory(directory):
+    """Yield an item for each ``.json`` file in a directory."""
+
+    names = sorted(
+        entry.name
+        for entry in os.scandir(directory)
+        if entry.name.endswith(".json") and entry.is_file()
+    )
+    for name in names:
+        path = os.path.join(directory, name)
+        yield path, "file", path
+
+
+def read_lines(fp, name):
+    """Yield an item for each non blank line of a JSON lines stream."""
+
+    for lineno, line in enumerate(fp, 1):
+        if line.strip():
+            yield "%s:%d" % (name, lineno), "json", line
+
+
+def _init_worker(questions, require_all):
+    global _plan, _require_all
+
+    _plan = ValidationPlan(questions)
+    _require_all = require_all
+
+
+def _check(item):
+    source, kind, payload = item
+
+    try:
+        if kind == "file":
+            with open(payload) as fp:
+                answers = json.load(fp)
+        else:
+            answers = json.loads(payload)
+    except (OSError, ValueError) as exc:
+        return False, _result(source, False, {}, str(exc))
+
+    if not isinstance(answers, dict):
+        return False, _result(source, False, {}, "Answers must be a JSON object")
+
+    result = _plan.validate(answers, require_all=_require_all)
+    return result.valid, _result(source, result.valid, result.errors, None)
+
+
+def _result(source, valid, errors, error):
+    return {"source": source, "valid": valid, "errors": errors, "error": error}
+
+
+def _check_chunk(items):
+    return [_check(item) for item in items]
+
+
+def _chunks(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_documents(questions, items, jobs=None, chunksize=64, require_all=False):
+    """Validate answer documents, yielding a ``(valid, result)`` tuple for
+    each one in the order they're read.
+
+    Documents are sent to the worker processes in chunks of `chunksize` and
+    only a few chunks per worker are read ahead, so a stream of any length
+    can be validated.
+
+    :param questions: The questions
+    :type questions:  list
+    :param items:     ``(source, kind, payload)`` tuples from
+                      :func:`read_directory` or :func:`read_lines`
+    :param jobs:      The number of worker processes; if 1 the documents are
+                      validated in this process.
+    :type jobs:       int
+    """
+
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1:
+        _init_worker(questions, require_all)
+        for item in items:
+            yield _check(item)
+        return
+
+    with ProcessPoolExecutor(
+        jobs, initializer=_init_worker, initargs=(questions, require_all)
+    ) as pool:
+        pending = deque()
+        for chunk in _chunks(items, chunksize):
+            pending.append(pool.submit(_check_chunk, chunk))
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+@click.command()
+@click.argument("questions", type=click.Path(exists=True, dir_okay=False))
+@click.argument("answers", type=click.Path(allow_dash=True))
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes [default: number of CPUs]",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="Number of documents sent to a worker at a time",
+)
+@click.option(
+    "--require-all",
+    is_flag=True,
+    default=False,
+    help="Treat a missing answer as invalid",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="File to write the results to [default: standard output]",
+)
+def main(questions, answers, jobs, chunksize, require_all, output):
+    """Validate the ANSWERS to the questions in QUESTIONS.
+
+    ANSWERS is a directory of .json files or a file of JSON lines, with - for
+    standard input.
+    """
+
+    try:
+        question_list = load_questions(questions)
+        ValidationPlan(question_list)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise click.ClickException("Unable to load questions: %s" % exc)
+
+    def report(items):
+        all_valid = True
+        for valid, result in validate_documents(
+            question_list, items, jobs, chunksize, require_all
+        ):
+            all_valid = all_valid and valid
+            output.write(json.dumps(result) + "\n")
+
+        return all_valid
+
+    if os.path.isdir(answers):
+        all_valid = report(read_directory(answers))
+    else:
+        name = "<stdin>" if answers == "-" else answers
+        with click.open_file(answers) as fp:
+            all_valid = report(read_lines(fp, name))
+
+    sys.exit(0 if all_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
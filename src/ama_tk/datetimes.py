@@ -0,0 +1,158 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Compiled parsers for the date and time formats used by the ``date`` and
+``time`` validators.
+
+Each format string is compiled once by :func:`compile_format`. The default ISO
+formats are parsed with :meth:`date.fromisoformat` and :meth:`time.fromisoformat`
+and formats using only numeric directives are parsed with a regular expression
+generated from the format, which accepts exactly what
+:meth:`datetime.strptime` accepts. Any other format is passed to
+:meth:`datetime.strptime`.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+from datetime import date, datetime, time
+from functools import lru_cache
+
+ISO_DATE_FORMAT = '%Y-%m-%d'
+ISO_TIME_FORMAT = '%H:%M'
+
+# The same expressions as used by the standard library's _strptime module.
+_directives = {
+    'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'f': r'(?P<f>[0-9]{1,6})',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    'y': r'(?P<y>\d\d)',
+    'Y': r'(?P<Y>\d\d\d\d)',
+    '%': '%',
+}
+
+_hints = [
+    ('%Y', 'YYYY'), ('%y', 'YY'), ('%m', 'MM'), ('%d', 'DD'),
+    ('%H', 'hh'), ('%M', 'mm'), ('%S', 'ss'),
+]
+
+_escape_re = re.compile(r'([\\.^$*+?\(\){}\[\]|])')
+_whitespace_re = re.compile(r'\s+')
+
+
+def _format_to_regex(spec):
+    """Convert a format string to a regular expression or return None if it
+    contains a directive which isn't supported.
+    """
+
+    spec = _escape_re.sub(r'\\\1', spec)
+    spec = _whitespace_re.sub(r'\\s+', spec)
+
+    parts = []
+    while '%' in spec:
+        pos = spec.index('%') + 1
+        if pos == len(spec):
+            return None
+
+        directive = _directives.get(spec[pos])
+        if directive is None:
+            return None
+
+        parts.append(spec[:pos - 1])
+        parts.append(directive)
+        spec = spec[pos + 1:]
+
+    parts.append(spec)
+
+    try:
+        return re.compile(''.join(parts), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+class DateTimeFormat(object):
+    """A compiled date/time format.
+
+    :param spec: A :meth:`datetime.strptime` format string
+    :type spec:  str
+    """
+
+    __slots__ = ('spec', 'hint', '_regex')
+
+    def __init__(self, spec):
+        self.spec = spec
+
+        hint = spec
+        for directive, text in _hints:
+            hint = hint.replace(directive, text)
+        self.hint = hint
+
+        self._regex = _format_to_regex(spec)
+
+    def datetime(self, value):
+        """Parse a string and return a :class:`datetime`.
+
+        :raises ValueError: If the string does not match the format.
+        """
+
+        if self._regex is None:
+            return datetime.strptime(value, self.spec)
+
+        found = self._regex.match(value)
+        if found is None or found.end() != len(value):
+            raise ValueError('%r does not match format %r' % (value, self.spec))
+
+        fields = found.groupdict()
+
+        year = 1900
+        if 'Y' in fields:
+            year = int(fields['Y'])
+        elif 'y' in fields:
+            year = int(fields['y'])
+            year += 2000 if year <= 68 else 1900
+
+        microsecond = 0
+        if 'f' in fields:
+            microsecond = int(fields['f'].ljust(6, '0'))
+
+        return datetime(
+            year,
+            int(fields.get('m', 1)),
+            int(fields.get('d', 1)),
+            int(fields.get('H', 0)),
+            int(fields.get('M', 0)),
+            int(fields.get('S', 0)),
+            microsecond,
+        )
+
+    def date(self, value):
+        """Parse a string and return a :class:`date`."""
+
+        if self.spec == ISO_DATE_FORMAT and len(value) == 10 and \
+                value[4] == '-' and value[7] == '-':
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+
+        return self.datetime(value).date()
+
+    def time(self, value):
+        """Parse a string and return a :class:`time`."""
+
+        if self.spec == ISO_TIME_FORMAT and len(value) == 5 and value[2] == ':':
+            try:
+                return time.fromisoformat(value)
+            except ValueError:
+                pass
+
+        return self.datetime(value).time()
+
+
+@lru_cache(maxsize=256)
+def compile_format(spec):
+    """Return the compiled :class:`DateTimeFormat` for a format string."""
+
+    return DateTimeFormat(spec)
@@ -0,0 +1,135 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""The dependencies between the default values of questions.
+
+A question's default can refer to the answers to other questions using
+:meth:`str.format` placeholders e.g. a default of ``{name}.py`` depends on the
+question named ``name``. A :class:`DependencyIndex` extracts the placeholders
+once so that when an answer changes only the questions which depend on it,
+directly or through other questions, need to be updated.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+from collections import deque
+from string import Formatter
+
+_field_name_re = re.compile(r'[^.\[]+')
+
+
+def placeholders(template):
+    """Return the names referred to by the placeholders in a format string.
+
+    Only the first part of each field is returned, so ``{path.parent}`` and
+    ``{items[0]}`` refer to ``path`` and ``items``. Positional fields and
+    malformed format strings are ignored.
+
+    :param template: The format string
+    :type template:  str
+    :rtype: frozenset
+    """
+
+    if template is None:
+        return frozenset()
+
+    names = set()
+    try:
+        for _text, field_name, format_spec, _conversion in \
+                Formatter().parse(str(template)):
+            if field_name:
+                m = _field_name_re.match(field_name)
+                if m is not None and not m.group(0).isdigit():
+                    names.add(m.group(0))
+
+            # Nested placeholders e.g. {value:{width}}
+            if format_spec and '{' in format_spec:
+                names.update(placeholders(format_spec))
+    except ValueError:
+        return frozenset()
+
+    return frozenset(names)
+
+
+class DependencyIndex(object):
+    """An index of the dependencies between question defaults.
+
+    :param defaults: The default value of each question, keyed by name, in
+                     the order the questions are displayed.
+    :type defaults:  dict
+    :raises ValueError: If the defaults refer to each other in a cycle.
+    """
+
+    def __init__(self, defaults):
+        self.dependencies = {}
+        self.dependents = {name: [] for name in defaults}
+
+        for name, default in defaults.items():
+            depends_on = frozenset(d for d in placeholders(default)
+                                   if d in self.dependents)
+            self.dependencies[name] = depends_on
+            for dependency in depends_on:
+                self.dependents[dependency].append(name)
+
+        self.order = self._sort(list(defaults))
+        self._position = {name: idx for idx, name in enumerate(self.order)}
+        self._affected = {}
+
+    def _sort(self, names):
+        """Sort the names so that every question comes after the questions it
+        depends on, keeping the display order where possible.
+        """
+
+        remaining = {name: len(self.dependencies[name]) for name in names}
+        ready = deque(name for name in names if remaining[name] == 0)
+        order = []
+
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in self.dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(names):
+            blocked = set(name for name in names if remaining[name] > 0)
+
+            # Remove the questions which depend on a cycle without being in it
+            pruned = True
+            while pruned:
+                pruned = False
+                for name in list(blocked):
+                    if not any(d in blocked for d in self.dependents[name]):
+                        blocked.discard(name)
+                        pruned = True
+
+            cycle = [name for name in names if name in blocked]
+            raise ValueError('The defaults for %s depend on each other' %
+                             ', '.join(cycle))
+
+        return order
+
+    def affected(self, name):
+        """Return the names of the questions which depend on `name`, directly
+        or indirectly, in the order they should be updated.
+
+        :rtype: tuple
+        """
+
+        try:
+            return self._affected[name]
+        except KeyError:
+            pass
+
+        found = set()
+        stack = list(self.dependents.get(name, ()))
+        while stack:
+            dependent = stack.pop()
+            if dependent not in found:
+                found.add(dependent)
+                stack.extend(self.dependents[dependent])
+
+        affected = tuple(sorted(found, key=self._position.__getitem__))
+        self._affected[name] = affected
+        return affected
@@ -0,0 +1,149 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Discovery of the validators provided by other packages.
+
+Packages provide validators by declaring entry points in the
+``ama.validators`` group, e.g. in :file:`pyproject.toml` ::
+
+   [tool.poetry.plugins."ama.validators"]
+   "postcode" = "mypackage.validators:Postcode"
+
+The entry point's object is a validator factory in the same form as the built
+in validators i.e. it is called with the question's specification and returns
+the validation function.
+
+Scanning the installed distributions for entry points is slow so the
+name to ``module:attr`` index is stored in
+:file:`$XDG_CACHE_HOME/ama_tk/validators.json` along with a fingerprint of the
+distribution metadata on :data:`sys.path`. The index is only rebuilt when a
+package is installed or removed, which changes the fingerprint. Nothing is imported until
+a validator is first used.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import hashlib
+import json
+import os
+import sys
+import threading
+
+ENTRY_POINT_GROUP = 'ama.validators'
+METADATA_SUFFIXES = ('.dist-info', '.egg-info')
+
+_index = None
+_lock = threading.Lock()
+
+
+def cache_dir():
+    """Return the directory the validator index is stored in."""
+
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ama_tk')
+
+
+def fingerprint():
+    """Return a fingerprint of the installed distributions.
+
+    Only the directories on :data:`sys.path` which contain distribution
+    metadata (``*.dist-info`` or ``*.egg-info``) are included, so changes to
+    the current directory or to source trees on the path don't cause the index
+    to be rebuilt. Installing or removing a distribution changes the names of
+    the metadata directories and the modification time of the directory
+    containing them.
+    """
+
+    h = hashlib.sha1(sys.version.encode('utf-8'))
+    for path in sys.path:
+        try:
+            with os.scandir(path or os.curdir) as it:
+                names = sorted(entry.name for entry in it
+                               if entry.name.endswith(METADATA_SUFFIXES))
+            mtime = os.stat(path or os.curdir).st_mtime_ns
+        except OSError:
+            continue
+
+        if not names:
+            continue
+
+        h.update(('%s\0%d\0' % (path, mtime)).encode('utf-8', 'surrogateescape'))
+        for name in names:
+            h.update((name + '\0').encode('utf-8', 'surrogateescape'))
+
+    return h.hexdigest()
+
+
+def scan_entry_points():
+    """Read the validator entry points from the installed distributions.
+
+    :returns: A dictionary of validator name to ``module:attr`` reference
+    """
+
+    from importlib.metadata import entry_points
+
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        eps = eps.select(group=ENTRY_POINT_GROUP)
+    else:
+        eps = eps.get(ENTRY_POINT_GROUP, [])
+
+    return {ep.name: ep.value for ep in eps}
+
+
+def _read_cache(filename, key):
+    try:
+        with open(filename) as fp:
+            data = json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get('fingerprint') != key:
+        return None
+
+    validators = data.get('validators')
+    if not isinstance(validators, dict):
+        return None
+
+    return validators
+
+
+def _write_cache(filename, key, validators):
+    import tempfile
+
+    directory = os.path.dirname(filename)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.validators')
+        with os.fdopen(fd, 'w') as fp:
+            json.dump({'fingerprint': key, 'validators': validators}, fp)
+        os.replace(tmp, filename)
+    except OSError:
+        pass
+
+
+def validator_index(refresh=False):
+    """Return the index of validator names to ``module:attr`` references for
+    all the installed validator entry points.
+
+    :param refresh: If True ignore the cached index and scan the installed
+                    distributions again.
+    :type refresh:  bool
+    """
+
+    global _index
+
+    with _lock:
+        if _index is not None and not refresh:
+            return _index
+
+        filename = os.path.join(cache_dir(), 'validators.json')
+        key = fingerprint()
+
+        index = None if refresh else _read_cache(filename, key)
+        if index is None:
+            index = scan_entry_points()
+            _write_cache(filename, key, index)
+
+        _index = index
+        return _index
@@ -0,0 +1,107 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Offline email address matching used by the ``email`` validator.
+
+Addresses are matched against a precompiled expression for the common
+``dot-atom@domain`` form of RFC 5322 addresses along with the RFC 5321 length
+limits. No network access is needed.
+
+The top level domain can optionally be checked against a set of known domains,
+either the bundled list in :data:`BUILTIN_TLDS_FILE` or another list loaded
+with :func:`load_tlds`, such as the list published by IANA at
+https://data.iana.org/TLD/tlds-alpha-by-domain.txt
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import re
+import threading
+
+_atext = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]"
+_label = r'[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?'
+_tld = r'(?:[A-Za-z]{2,63}|[Xx][Nn]--[A-Za-z0-9-]{1,59})'
+
+address_re = re.compile(
+    r'(%s+(?:\.%s+)*)@((?:%s\.)+(%s))\Z' % (_atext, _atext, _label, _tld)
+)
+
+MAX_ADDRESS_LENGTH = 254
+MAX_LOCAL_LENGTH = 64
+
+BUILTIN_TLDS_FILE = os.path.join(os.path.dirname(__file__), 'tlds.txt')
+"""The bundled list of the top level domains in the DNS root zone."""
+
+_tld_files = {}
+_tld_lock = threading.Lock()
+
+
+def load_tlds(filename):
+    """Load a list of top level domains, one per line, from a file.
+
+    Blank lines and lines starting with ``#`` are ignored. The result is
+    cached until the file's modification time changes.
+
+    :param filename: The file to load
+    :type filename:  str
+    :rtype: frozenset
+    """
+
+    filename = os.path.abspath(filename)
+    mtime = os.stat(filename).st_mtime
+
+    with _tld_lock:
+        cached = _tld_files.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    tlds = set()
+    with open(filename, 'rb') as fp:
+        for line in fp:
+            line = line.strip()
+            if line and not line.startswith(b'#'):
+                tlds.add(line.decode('ascii', 'replace').lower())
+
+    tlds = frozenset(tlds)
+    with _tld_lock:
+        _tld_files[filename] = (mtime, tlds)
+
+    return tlds
+
+
+def resolve_tlds(source):
+    """Convert the ``tlds`` option of the ``email`` validator to a container
+    of top level domains; ``builtin`` for the bundled list in
+    :data:`BUILTIN_TLDS_FILE` otherwise the name of a file to load with
+    :func:`load_tlds`.
+    """
+
+    if not source:
+        return None
+    elif source == 'builtin':
+        return load_tlds(BUILTIN_TLDS_FILE)
+    else:
+        return load_tlds(source)
+
+
+def is_email(value, tlds=None):
+    """Check that a value looks like an email address.
+
+    :param value: The value to check
+    :type value:  str
+    :param tlds: If not None, a container of the lower case top level
+                 domains to accept
+    :rtype: bool
+    """
+
+    if len(value) > MAX_ADDRESS_LENGTH:
+        return False
+
+    m = address_re.match(value)
+    if m is None or len(m.group(1)) > MAX_LOCAL_LENGTH:
+        return False
+
+    if tlds is not None and m.group(3).lower() not in tlds:
+        return False
+
+    return True
@@ -0,0 +1,538 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Helpers used by the ``path`` validators.
+
+Path metadata (whether a path exists, is a directory and is empty) can be
+cached so that repeated validation of the same directory doesn't hit the
+filesystem every time. The cache is disabled by default; call
+:func:`enable_path_cache` to turn it on.
+
+Entries expire after a time to live and the least recently used entries are
+dropped when the cache is full. On Linux, if the :mod:`inotify_simple` package
+is installed, entries can also be invalidated as soon as the filesystem
+changes.
+
+:func:`is_valid_path_name` checks whether a path could be created using only
+the rules for path names, either those of POSIX or of Windows, without
+creating anything on disk.
+
+:class:`Pathspec` checks a directory's contents against a set of include and
+exclude glob patterns in a single pass over the directory.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import fnmatch
+import glob
+import ntpath
+import os
+import re
+import stat
+import threading
+from collections import OrderedDict, namedtuple
+from time import monotonic
+
+PathInfo = namedtuple('PathInfo', 'exists is_dir empty')
+"""Metadata for a path. `empty` is True or False for a readable directory when
+its emptiness was asked for and None otherwise."""
+
+MISSING = PathInfo(False, False, None)
+
+PathspecMatch = namedtuple('PathspecMatch', 'included excluded')
+"""The include and exclude patterns which matched a directory's contents."""
+
+DEFAULT_NAME_MAX = 255
+DEFAULT_PATH_MAX = 4096
+
+WINDOWS_NAME_MAX = 255
+WINDOWS_PATH_MAX = 260
+
+PATH_NAME_PROFILES = ('posix', 'windows')
+"""The sets of rules :func:`is_valid_path_name` can check path names with."""
+
+WINDOWS_RESERVED_NAMES = frozenset(
+    ['CON', 'PRN', 'AUX', 'NUL'] +
+    ['COM%d' % i for i in range(1, 10)] +
+    ['LPT%d' % i for i in range(1, 10)]
+)
+
+_windows_invalid_re = re.compile(r'[<>:"|?*\x00-\x1f]')
+_windows_separator_re = re.compile(r'[\\/]')
+
+
+def stat_path(path, need_empty=False):
+    """Read the metadata for a path from the filesystem.
+
+    :param path: The path to examine
+    :type path:  str
+    :param need_empty: If True and the path is a directory, read the directory
+                       to find out whether it is empty.
+    :type need_empty:  bool
+    :rtype: PathInfo
+    """
+
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return MISSING
+
+    if not stat.S_ISDIR(st.st_mode):
+        return PathInfo(True, False, None)
+
+    if not need_empty:
+        return PathInfo(True, True, None)
+
+    try:
+        with os.scandir(path) as it:
+            empty = next(it, None) is None
+    except OSError:
+        empty = None
+
+    return PathInfo(True, True, empty)
+
+
+class _InotifyWatcher(object):
+    """Tracks the directories containing cached paths and reports the paths
+    which may have changed since the last poll.
+    """
+
+    def __init__(self):
+        import inotify_simple
+
+        self._flags = inotify_simple.flags
+        self._mask = (self._flags.CREATE | self._flags.DELETE |
+                      self._flags.MOVED_FROM | self._flags.MOVED_TO |
+                      self._flags.DELETE_SELF | self._flags.MOVE_SELF)
+        self._inotify = inotify_simple.INotify()
+        self._paths = {}
+        self._watches = {}
+        self._users = {}
+
+    def watch(self, path, info):
+        dirs = [os.path.dirname(path)]
+        if info.is_dir:
+            dirs.append(path)
+
+        for d in dirs:
+            if d in self._watches:
+                self._users[d] += 1
+                continue
+
+            try:
+                wd = self._inotify.add_watch(d, self._mask)
+            except OSError:
+                continue
+
+            self._watches[d] = wd
+            self._paths[wd] = d
+            self._users[d] = 1
+
+    def unwatch(self, path, info):
+        dirs = [os.path.dirname(path)]
+        if info.is_dir:
+            dirs.append(path)
+
+        for d in dirs:
+            if d not in self._users:
+                continue
+
+            self._users[d] -= 1
+            if self._users[d] == 0:
+                wd = self._watches.pop(d)
+                del self._paths[wd]
+                del self._users[d]
+                try:
+                    self._inotify.rm_watch(wd)
+                except OSError:
+                    pass
+
+    def changed(self):
+        changed = set()
+        for event in self._inotify.read(timeout=0):
+            d = self._paths.get(event.wd)
+            if d is None:
+                continue
+
+            changed.add(d)
+            if event.name:
+                changed.add(os.path.join(d, event.name))
+
+        return changed
+
+    def close(self):
+        self._inotify.close()
+
+
+def _empty_unknown(info):
+    return info.is_dir and info.empty is None
+
+
+class PathCache(object):
+    """A bounded cache of :class:`PathInfo` entries.
+
+    :param ttl: The number of seconds an entry remains valid
+    :type ttl:  float
+    :param maxsize: The maximum number of entries to keep
+    :type maxsize:  int
+    :param inotify: If True use inotify, when available, to invalidate entries
+                    as soon as the filesystem changes.
+    :type inotify:  bool
+    """
+
+    def __init__(self, ttl=2.0, maxsize=1024, inotify=False):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._watcher = None
+        self.hits = 0
+        self.misses = 0
+
+        if inotify:
+            try:
+                self._watcher = _InotifyWatcher()
+            except (ImportError, OSError):
+                self._watcher = None
+
+    @property
+    def uses_inotify(self):
+        return self._watcher is not None
+
+    def info(self, path, need_empty=False):
+        """Return the :class:`PathInfo` for `path` reading it from the
+        filesystem if it isn't cached or the cached entry has expired.
+
+        A cached directory entry which was read without `need_empty` is read
+        again the first time its emptiness is needed.
+        """
+
+        key = os.path.abspath(path)
+        now = monotonic()
+
+        with self._lock:
+            if self._watcher is not None:
+                for changed in self._watcher.changed():
+                    self._discard(changed)
+
+            entry = self._entries.get(key)
+            if (entry is not None and entry[0] > now and
+                    not (need_empty and _empty_unknown(entry[1]))):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+
+        info = stat_path(key, need_empty)
+
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (now + self.ttl, info)
+            if self._watcher is not None:
+                self._watcher.watch(key, info)
+
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+
+        return info
+
+    def invalidate(self, path):
+        """Remove any cached entry for `path`"""
+
+        with self._lock:
+            self._discard(os.path.abspath(path))
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        with self._lock:
+            for key in list(self._entries):
+                self._discard(key)
+
+    def close(self):
+        """Clear the cache and release the inotify file descriptor."""
+
+        self.clear()
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None and self._watcher is not None:
+            self._watcher.unwatch(key, entry[1])
+
+
+path_cache = None
+
+
+def enable_path_cache(ttl=2.0, maxsize=1024, inotify=False):
+    """Cache the path metadata used by the ``path`` validators.
+
+    See :class:`PathCache` for the meaning of the arguments.
+
+    :returns: The new cache
+    :rtype: PathCache
+    """
+
+    global path_cache
+
+    disable_path_cache()
+    path_cache = PathCache(ttl=ttl, maxsize=maxsize, inotify=inotify)
+    return path_cache
+
+
+def disable_path_cache():
+    """Stop caching path metadata."""
+
+    global path_cache
+
+    if path_cache is not None:
+        path_cache.close()
+        path_cache = None
+
+
+def path_info(path, need_empty=False):
+    """Return the :class:`PathInfo` for a path, from the cache if it is
+    enabled.
+
+    Finding out whether a directory is empty means reading it as well as
+    calling :func:`os.stat`, so `empty` is only filled in when `need_empty` is
+    True.
+    """
+
+    cache = path_cache
+    if cache is not None:
+        return cache.info(path, need_empty)
+
+    return stat_path(path, need_empty)
+
+
+_device_limits = {}
+
+
+def _pathconf(path, name, default):
+    try:
+        value = os.pathconf(path, name)
+    except (AttributeError, OSError, ValueError):
+        return default
+
+    if value is None or value < 0:
+        return default
+
+    return value
+
+
+def directory_limits(directory):
+    """Return the nearest existing ancestor of `directory` along with the
+    maximum component and path lengths for the filesystem it is on.
+
+    The limits are read with :func:`os.pathconf` once per mounted device. The
+    ancestor is found again on every call, as directories are created and
+    removed, using the path cache if it is enabled.
+
+    :rtype: tuple
+    """
+
+    ancestor = directory
+    while not path_info(ancestor).is_dir:
+        parent = os.path.dirname(ancestor)
+        if parent == ancestor:
+            return None, DEFAULT_NAME_MAX, DEFAULT_PATH_MAX
+
+        ancestor = parent
+
+    try:
+        device = os.stat(ancestor).st_dev
+    except OSError:
+        device = None
+
+    limits = _device_limits.get(device)
+    if limits is None:
+        limits = (
+            _pathconf(ancestor, 'PC_NAME_MAX', DEFAULT_NAME_MAX),
+            _pathconf(ancestor, 'PC_PATH_MAX', DEFAULT_PATH_MAX),
+        )
+        if device is not None:
+            _device_limits[device] = limits
+
+    return (ancestor,) + limits
+
+
+def _is_valid_posix_name(path):
+    if '\0' in path:
+        return False
+
+    path = os.path.abspath(path)
+    _ancestor, name_max, path_max = directory_limits(os.path.dirname(path))
+
+    try:
+        encoded = os.fsencode(path)
+    except UnicodeError:
+        return False
+
+    if len(encoded) >= path_max:
+        return False
+
+    for component in encoded.split(b'/'):
+        if len(component) > name_max:
+            return False
+
+    return True
+
+
+def _is_valid_windows_name(path):
+    if '\0' in path:
+        return False
+
+    if not path.startswith('\\\\?\\') and len(path) >= WINDOWS_PATH_MAX:
+        return False
+
+    _drive, rest = ntpath.splitdrive(path)
+    for component in _windows_separator_re.split(rest):
+        if component in ('', '.', '..'):
+            continue
+
+        if len(component) > WINDOWS_NAME_MAX:
+            return False
+
+        if _windows_invalid_re.search(component):
+            return False
+
+        if component[-1] in ' .':
+            return False
+
+        stem = component.split('.', 1)[0].rstrip(' ').upper()
+        if stem in WINDOWS_RESERVED_NAMES:
+            return False
+
+    return True
+
+
+def is_valid_path_name(path, profile=None):
+    """Check that `path` is a valid name for a path without touching the disk
+    apart from reading (and caching) the filesystem's name limits.
+
+    :param path: The path to check
+    :type path:  str
+    :param profile: The set of rules to apply; ``posix`` or ``windows``.
+                    Defaults to the rules for the current platform.
+    :type profile:  str
+    :rtype: bool
+    """
+
+    if profile is None:
+        profile = 'windows' if os.name == 'nt' else 'posix'
+
+    if profile == 'windows':
+        return _is_valid_windows_name(path)
+    elif profile == 'posix':
+        return _is_valid_posix_name(path)
+    else:
+        raise ValueError('Unknown path name profile %s' % profile)
+
+
+def is_creatable(path):
+    """Check with a single :func:`os.access` call that the nearest existing
+    ancestor of `path` is writable.
+    """
+
+    parent = os.path.dirname(os.path.abspath(path))
+    ancestor = directory_limits(parent)[0]
+    if ancestor is None:
+        return False
+
+    return os.access(ancestor, os.W_OK | os.X_OK)
+
+
+class Pathspec(object):
+    """A compiled set of include and exclude glob patterns.
+
+    Patterns which only match names within the directory are combined into a
+    single regular expression and checked during one :func:`os.scandir` pass
+    which stops as soon as every include pattern has matched and an exclude
+    pattern has been seen. Patterns containing a path separator are passed to
+    :func:`glob.glob`.
+
+    As with :mod:`glob`, wildcards don't match names starting with a ``.``
+    unless the pattern also starts with one.
+
+    :param included: Patterns which must match at least one name
+    :param excluded: Patterns which must not match any name
+    """
+
+    def __init__(self, included, excluded):
+        self.included = tuple(included)
+        self.excluded = tuple(excluded)
+
+        flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+
+        self._local = []
+        self._globbed = []
+        for pattern, include in [(p, True) for p in self.included] + \
+                                [(p, False) for p in self.excluded]:
+            if os.sep in pattern or (os.altsep and os.altsep in pattern):
+                self._globbed.append((pattern, include))
+            else:
+                regex = re.compile(fnmatch.translate(pattern), flags)
+                self._local.append((pattern, include, regex, pattern.startswith('.')))
+
+        if self._local:
+            self._combined = re.compile(
+                '|'.join('(?:%s)' % fnmatch.translate(p[0]) for p in self._local),
+                flags,
+            )
+        else:
+            self._combined = None
+
+    def scan(self, directory):
+        """Find the patterns which match the contents of `directory`.
+
+        :rtype: PathspecMatch
+        """
+
+        directory = directory or os.curdir
+        included = set()
+        excluded = set()
+
+        pending = list(self._local)
+        has_excludes = any(not p[1] for p in pending)
+        include_count = sum(1 for p in pending if p[1])
+
+        if pending:
+            try:
+                it = os.scandir(directory)
+            except OSError:
+                it = None
+
+            if it is not None:
+                with it:
+                    for entry in it:
+                        name = entry.name
+                        if not self._combined.match(name):
+                            continue
+
+                        hidden = name.startswith('.')
+                        for item in pending:
+                            pattern, include, regex, dotted = item
+                            if hidden and not dotted:
+                                continue
+
+                            if regex.match(name):
+                                (included if include else excluded).add(pattern)
+
+                        pending = [p for p in pending
+                                   if p[0] not in (included if p[1] else excluded)]
+
+                        if len(included) == include_count and \
+                                (excluded or not has_excludes):
+                            break
+
+        for pattern, include in self._globbed:
+            if glob.glob(os.path.join(directory, pattern)):
+                (included if include else excluded).add(pattern)
+
+        return PathspecMatch(
+            tuple(p for p in self.included if p in included),
+            tuple(p for p in self.excluded if p in excluded),
+        )
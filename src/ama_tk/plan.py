@@ -0,0 +1,142 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Validate a complete set of answers without a user interface.
+
+A :class:`ValidationPlan` is compiled once from a set of questions, in the
+same form as the ``question_data`` loaded by an :class:`~ama.asker.Asker`.
+Questions which share a type and format share a single validator and the
+groups are ordered so the cheapest checks run first, with the checks which
+touch the filesystem last. A whole answers dictionary is then validated in
+a single pass ::
+
+    plan = ValidationPlan.from_question_data(question_data)
+    result = plan.validate(answers)
+    if not result.valid:
+        print(result.errors)
+
+The plan can also be exported as a :mod:`cerberus` schema.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict, namedtuple
+
+from ama_tk.validator import OneOf, get_validator, validator_cost
+
+PlanResult = namedtuple('PlanResult', 'valid answers errors')
+"""The result of validating a set of answers. `answers` holds the validated
+value of each valid answer and `errors` the message for each invalid one."""
+
+PlanStep = namedtuple('PlanStep', 'cost validator spec validate names')
+"""A group of questions which share a validator."""
+
+
+def _freeze(value):
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    else:
+        return value
+
+
+class ValidationPlan(object):
+    """A compiled plan to validate the answers to a set of questions.
+
+    :param questions: The questions; dictionaries with at least ``name`` and
+                      ``type`` keys and optionally a ``format``.
+    :type questions:  list
+    """
+
+    def __init__(self, questions):
+        groups = OrderedDict()
+        self.names = []
+
+        for question in questions:
+            name = question['name']
+            validator = question['type']
+            spec = question.get('format', None)
+
+            key = (_freeze(validator), _freeze(spec))
+            if key not in groups:
+                groups[key] = (validator, spec, [])
+            groups[key][2].append(name)
+            self.names.append(name)
+
+        steps = []
+        for validator, spec, names in groups.values():
+            if isinstance(validator, list):
+                validate = OneOf(*validator)
+            else:
+                validate = get_validator(validator, spec)
+
+            steps.append(PlanStep(validator_cost(validator), validator, spec,
+                                  validate, tuple(names)))
+
+        # sorted is stable so groups of the same cost stay in question order
+        self.steps = tuple(sorted(steps, key=lambda step: step.cost))
+
+    @classmethod
+    def from_question_data(cls, question_data):
+        """Create a plan from question data containing a ``questions`` list."""
+
+        return cls(question_data['questions'])
+
+    def validate(self, answers, require_all=False):
+        """Validate a dictionary of answers.
+
+        :param answers: The answers keyed by question name
+        :type answers:  dict
+        :param require_all: If True a missing answer is an error, otherwise
+                            missing answers are ignored.
+        :type require_all:  bool
+        :rtype: PlanResult
+        """
+
+        values = {}
+        errors = {}
+
+        for step in self.steps:
+            validate = step.validate
+            for name in step.names:
+                try:
+                    value = answers[name]
+                except KeyError:
+                    if require_all:
+                        errors[name] = 'No answer provided'
+                    continue
+
+                try:
+                    values[name] = validate(value)
+                except (TypeError, ValueError) as exc:
+                    errors[name] = str(exc)
+
+        return PlanResult(not errors, values, errors)
+
+    def to_cerberus(self, require_all=False):
+        """Export the plan as a :mod:`cerberus` schema which checks each field
+        with the plan's validators.
+
+        :rtype: dict
+        """
+
+        schema = {}
+        for step in self.steps:
+            for name in step.names:
+                schema[name] = {
+                    'nullable': True,
+                    'required': require_all,
+                    'check_with': _cerberus_check(step.validate),
+                }
+
+        return schema
+
+
+def _cerberus_check(validate):
+    def check_with(field, value, error):
+        try:
+            validate(value)
+        except (TypeError, ValueError) as exc:
+            error(field, str(exc))
+
+    return check_with
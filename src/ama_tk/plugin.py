@@ -0,0 +1,38 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""The hooks which register the Tkinter asker with :mod:`ama`.
+
+This module is loaded for every :mod:`ama` command so it only imports
+:mod:`ama_tk.asker`, and through it Tkinter, when the asker class is needed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ama.hook.impl import hookimpl
+
+if TYPE_CHECKING:
+    import click
+
+
+@hookimpl  # type: ignore
+def ama_asker_class():
+    from ama_tk.asker import TkAsker
+
+    return TkAsker
+
+
+@hookimpl  # type: ignore
+def ama_asker_addoption(command: click.Command) -> click.Command:
+    import click
+
+    option = click.option(
+        "-i",
+        "--invalid",
+        "allow_invalid",
+        is_flag=True,
+        default=False,
+        help="Return answers even if they don't validate",
+    )
+    return option(command)
@@ -0,0 +1,208 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""The state of a question shared by the ways a question can be displayed.
+
+:class:`~ama_tk.asker.TkQuestion` creates the widgets for a single question and
+:class:`~ama_tk.virtual.VirtualQuestion` is displayed by a row of widgets
+shared with other questions. Both keep the answer, whether it has been edited
+and whether it's valid in a :class:`QuestionState` and only differ in where
+the answer's text is stored and how the state is displayed.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os.path
+
+import ama_tk.validator
+
+
+class QuestionState(object):
+    """The answer to a question and whether it's been edited and is valid.
+
+    Subclasses store the answer by implementing :meth:`_read` and
+    :meth:`_write`, display the state in :meth:`_show_valid` and
+    :meth:`_show_edited` and call :meth:`_set_initial_value` once they're
+    ready to display the answer.
+
+    :param asker: The :class:`~ama_tk.asker.TkAsker` asking the question
+    :param question: The question, as a dict
+    """
+
+    # The types whose answer isn't updated from the answers to other questions
+    _dont_update = ("bool", "yesno", "date", "time", "color", "password")
+
+    def __init__(self, asker, question):
+        self._asker = asker
+
+        self.key = question["name"]
+        self.message = question["message"]
+        self.help_text = question.get("help", "")
+        self._default = question.get("default", None)
+        self._validator = question["type"]
+        self._spec = question.get("format", None)
+
+        # The widget for a pipeline is chosen by its first stage
+        if ama_tk.validator.is_pipeline(self._validator):
+            self.type = ama_tk.validator.pipeline_stages(self._validator)[0][0]
+        else:
+            self.type = self._validator
+
+        if (
+            isinstance(self._spec, str)
+            and self._spec.startswith("path")
+            and self._default is not None
+        ):
+            self._default = os.path.normpath(self._default)
+
+        if isinstance(self.type, list):
+            self._validate = ama_tk.validator.OneOf(
+                *(str(choice) for choice in self.type)
+            )
+        else:
+            self._validate = ama_tk.validator.get_validator(
+                self._validator, self._spec
+            )
+
+        # The validated answer, cleared when the answer's text changes
+        self._value = None
+        self._value_cached = False
+
+        self._is_edited = False
+        self._is_valid = True
+
+    def _set_initial_value(self):
+        """Set the answer to the first choice, or to the default for the types
+        which aren't updated from the other answers.
+        """
+
+        if isinstance(self.type, list):
+            self.value = str(self.type[0])
+        elif self.type in ("bool", "yesno"):
+            self.value = self._default or False
+        elif self.type in self._dont_update and self._default is not None:
+            self.value = self._default
+
+    @property
+    def default(self):
+        return self._default
+
+    def update(self, current_answers):
+        """Update our unedited value with the other answers."""
+
+        if not self.edited and self.type not in self._dont_update:
+            _current_answers = {
+                k: v for k, v in current_answers.items() if v is not None
+            }
+
+            if self.type == "str" and self._default is None:
+                self._default = ""
+            updated_answer = str(self._default).format(**_current_answers)
+            self.value = updated_answer
+
+    @property
+    def value(self):
+        if not self.valid:
+            return ""
+
+        if not self._value_cached:
+            try:
+                self._value = self._validate(self._read())
+            except (TypeError, ValueError):
+                self._value = ""
+            self._value_cached = True
+
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        try:
+            validated = self._validate(value)
+        except (TypeError, ValueError):
+            self._write(value, None, False)
+            self.valid = False
+        else:
+            self._write(value, validated, True)
+            self._value = validated
+            self._value_cached = True
+            self.valid = True
+
+    def _invalidate_value(self, *args):
+        self._value_cached = False
+
+    @property
+    def valid(self):
+        return self._is_valid
+
+    @valid.setter
+    def valid(self, value):
+        value = bool(value)
+        if value != self._is_valid:
+            self._asker.validity_changed(self.key, value)
+
+        self._is_valid = value
+        self._show_valid()
+
+    @property
+    def edited(self):
+        return self._is_edited
+
+    @edited.setter
+    def edited(self, value):
+        self._is_edited = bool(value)
+        self._show_edited()
+
+    def edit(self, text):
+        """Respond to a key press changing the answer's text to `text`."""
+
+        if not self.edited:
+            self.edited = True
+
+        self._asker.answer_changed(self.key, text)
+
+    def check(self, text):
+        """Validate the answer's text when its widget loses the focus.
+
+        :returns: False if the text isn't valid
+        :rtype: bool
+        """
+
+        self._asker.flush_changes()
+
+        accepted = True
+        if self._spec == "nonempty" and not text:
+            self.valid = False
+            self.edited = True
+        elif text.strip() == "":
+            self.valid = True
+            self.edited = False
+        else:
+            try:
+                self._validate(text)
+                self.valid = True
+            except (ValueError, TypeError):
+                self.valid = False
+                accepted = False
+
+        self._asker.check_invalid()
+        return accepted
+
+    def _read(self):
+        """Return the answer's text as displayed.
+
+        :raises ValueError: If the text can't be read
+        """
+
+        raise NotImplementedError
+
+    def _write(self, value, validated, valid):
+        """Display a new answer; `validated` is the result of validating
+        `value` if `valid` is True.
+        """
+
+        raise NotImplementedError
+
+    def _show_valid(self):
+        pass
+
+    def _show_edited(self):
+        pass
@@ -0,0 +1,69 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Coalesce the changes made by keystrokes so they're processed in batches.
+
+Every keystroke in an entry changes its answer, which can update the defaults
+of the questions which depend on it. A :class:`KeystrokeScheduler` records
+the latest value for each question and processes the changes once, either when
+Tk is next idle or when no key has been pressed for a debounce period. Pending
+changes can be processed immediately with :meth:`KeystrokeScheduler.flush`
+e.g. when an entry loses the focus.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from collections import OrderedDict
+
+
+class KeystrokeScheduler(object):
+    """Schedule the processing of changed answers.
+
+    :param widget:   The widget used to schedule callbacks
+    :param callback: Called with a ``(key, value)`` tuple for each changed
+                     answer
+    :param debounce: The time in milliseconds to wait after the last change
+                     before processing the changes. If 0 the changes are
+                     processed when Tk is next idle.
+    :type debounce:  int
+    """
+
+    def __init__(self, widget, callback, debounce=0):
+        self._widget = widget
+        self._callback = callback
+        self.debounce = debounce
+
+        self._pending = OrderedDict()
+        self._after_id = None
+
+    @property
+    def pending(self):
+        """True if there are changes waiting to be processed."""
+
+        return bool(self._pending)
+
+    def schedule(self, key, value):
+        """Record the latest value of an answer and schedule processing it."""
+
+        self._pending[key] = value
+
+        if self.debounce:
+            if self._after_id is not None:
+                self._widget.after_cancel(self._after_id)
+            self._after_id = self._widget.after(self.debounce, self.flush)
+        elif self._after_id is None:
+            self._after_id = self._widget.after_idle(self.flush)
+
+    def flush(self):
+        """Process the pending changes now."""
+
+        self.cancel()
+
+        while self._pending:
+            self._callback(self._pending.popitem(last=False))
+
+    def cancel(self):
+        """Cancel the scheduled processing, leaving the changes pending."""
+
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
@@ -0,0 +1,187 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Parses the specification strings passed to the validators.
+
+A specification is a list of elements separated by ``|``. Elements can be
+enclosed in double quotes to include a ``|`` and a double quote can be included
+in a quoted element by doubling it.
+
+Each element is either a positional argument or, if it contains an ``=`` which
+is not preceded by a backslash, a keyword argument. The values of the
+:data:`NUMERIC_KEYS` which look like numbers are converted to :class:`int` or
+:class:`float` so the range checks receive typed parameters e.g.
+``min=3|max=6.5`` is compiled to ``{'min': 3, 'max': 6.5}``. All other values,
+including those passed to validators registered through entry points, are
+passed as strings, as they always have been, and it's up to the validator to
+convert them.
+
+Compiled specifications are cached so each distinct string is only parsed once
+and the same :class:`Spec` instance is returned for equal strings.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+DELIMITER = '|'
+QUOTECHAR = '"'
+
+# The keyword arguments whose values are converted to numbers
+NUMERIC_KEYS = frozenset(['min', 'max'])
+
+_INT_RE = re.compile(r'[+-]?\d+\Z')
+_FLOAT_RE = re.compile(r'[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?\Z')
+
+_START, _PLAIN, _QUOTED, _QUOTE_IN_QUOTED = range(4)
+
+
+class Spec(object):
+    """An immutable, compiled specification.
+
+    :param source: The string the specification was compiled from
+    :param args: The positional arguments
+    :param kwargs: The keyword arguments
+    """
+
+    __slots__ = ('source', 'args', 'kwargs')
+
+    def __init__(self, source, args=(), kwargs=None):
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'args', tuple(args))
+        object.__setattr__(self, 'kwargs', MappingProxyType(dict(kwargs or {})))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Spec objects are immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, Spec):
+            return NotImplemented
+
+        return self.args == other.args and dict(self.kwargs) == dict(other.kwargs)
+
+    def __hash__(self):
+        return hash((self.args, tuple(sorted(self.kwargs.items()))))
+
+    def __bool__(self):
+        return bool(self.args or self.kwargs)
+
+    def __repr__(self):
+        return 'Spec(%r, args=%r, kwargs=%r)' % (self.source, self.args,
+                                                 dict(self.kwargs))
+
+    def get(self, key, default=None):
+        return self.kwargs.get(key, default)
+
+
+EMPTY_SPEC = Spec(None)
+
+
+@lru_cache(maxsize=4096)
+def split_spec(source):
+    """Split a specification string into its elements.
+
+    :param source: The specification string
+    :type source:  str
+    :rtype: tuple
+    """
+
+    elems = []
+    buf = []
+    row_started = False
+    state = _START
+
+    for c in source:
+        if state == _QUOTED:
+            if c == QUOTECHAR:
+                state = _QUOTE_IN_QUOTED
+            else:
+                buf.append(c)
+            continue
+
+        if state == _QUOTE_IN_QUOTED and c == QUOTECHAR:
+            buf.append(c)
+            state = _QUOTED
+        elif c == DELIMITER:
+            elems.append(''.join(buf))
+            buf = []
+            row_started = True
+            state = _START
+        elif c == '\r' or c == '\n':
+            if row_started or buf or state != _START:
+                elems.append(''.join(buf))
+            buf = []
+            row_started = False
+            state = _START
+        elif state == _START and c == QUOTECHAR:
+            state = _QUOTED
+        else:
+            buf.append(c)
+            state = _PLAIN
+
+    if row_started or buf or state != _START:
+        elems.append(''.join(buf))
+
+    return tuple(elems)
+
+
+def convert_value(value):
+    """Convert a keyword argument's value to an :class:`int` or :class:`float`
+    if it looks like one, otherwise return it unchanged.
+    """
+
+    if _INT_RE.match(value):
+        return int(value)
+    elif _FLOAT_RE.match(value):
+        return float(value)
+    else:
+        return value
+
+
+def split_keyword(elem):
+    """Split an element into a ``(key, value)`` tuple at the first ``=`` which
+    is not preceded by a backslash. Returns None if there isn't one.
+    """
+
+    pos = elem.find('=')
+    while pos > 0 and elem[pos - 1] == '\\':
+        pos = elem.find('=', pos + 1)
+
+    if pos == -1:
+        return None
+
+    return elem[:pos], elem[pos + 1:]
+
+
+@lru_cache(maxsize=4096)
+def _compile(source):
+    args = []
+    kwargs = {}
+    for elem in split_spec(source):
+        kv = split_keyword(elem)
+        if kv is None:
+            args.append(elem)
+        else:
+            key, value = kv
+            if key in NUMERIC_KEYS:
+                value = convert_value(value)
+            kwargs[key] = value
+
+    return Spec(source, args, kwargs)
+
+
+def compile_spec(source):
+    """Compile a specification string into a :class:`Spec`.
+
+    :param source: The specification string, a :class:`Spec` or None
+    :rtype: Spec
+    """
+
+    if isinstance(source, Spec):
+        return source
+
+    if not source:
+        return EMPTY_SPEC
+
+    return _compile(source)
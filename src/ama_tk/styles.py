@@ -0,0 +1,72 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""The fonts and ttk styles shared by all the questions in a window.
+
+Creating a :class:`tkinter.font.Font` or configuring a :class:`ttk.Style`
+creates Tcl objects and causes the widgets using the style to be laid out
+again, so the styles are configured once for each Tk root by
+:func:`styles_for` and the questions only select a style by name.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from tkinter import font, ttk
+
+HEADER_LABEL = "header.TLabel"
+QUESTION_LABEL = "question.TLabel"
+INFO_LABEL = "info.TLabel"
+ERROR_LABEL = "error.TLabel"
+
+EDITED_ENTRY = "edited.TEntry"
+UNEDITED_ENTRY = "unedited.TEntry"
+
+ERROR_BACKGROUND = "#e00"
+
+
+class StyleRegistry(object):
+    """The fonts and styles for a Tk root.
+
+    :param root: The Tk root
+    :type root:  :class:`tkinter.Tk`
+    """
+
+    def __init__(self, root):
+        self.style = ttk.Style(root)
+
+        self.text_font = font.Font(root=root, font=("TkTextFont",))
+        self.heading_font = font.Font(root=root, font=("TkHeadingFont", 0, font.BOLD))
+
+        self.style.configure(HEADER_LABEL, font=self.heading_font)
+        self.style.configure(QUESTION_LABEL, font=self.text_font)
+        self.style.configure(INFO_LABEL, font=self.text_font)
+        self.style.configure(
+            ERROR_LABEL, font=self.text_font, background=ERROR_BACKGROUND
+        )
+
+        self.style.configure(EDITED_ENTRY)
+        self.style.configure(UNEDITED_ENTRY)
+
+    def entry_style(self, edited):
+        """Return the name of the style for an entry."""
+
+        return EDITED_ENTRY if edited else UNEDITED_ENTRY
+
+    def info_style(self, valid):
+        """Return the name of the style for a question's information label."""
+
+        return INFO_LABEL if valid else ERROR_LABEL
+
+
+def styles_for(root):
+    """Return the :class:`StyleRegistry` for a Tk root, creating it the first
+    time it's needed.
+
+    The registry is stored on the root, as the :class:`ttk.Style` it holds
+    refers to the root, so both are released together.
+    """
+
+    registry = getattr(root, "_ama_styles", None)
+    if registry is None:
+        registry = StyleRegistry(root)
+        root._ama_styles = registry
+    return registry
@@ -31,35 +31,66 @@ Validator Name            Tests that the value...
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-import os
+import re
 import sys
-import csv
-import gettext
-import glob
-import shutil
+import contextvars
 import string
-import tempfile
-from io import StringIO
+import threading
+import warnings
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from contextlib import contextmanager
 from datetime import datetime, date, time
-from functools import partial
+from functools import lru_cache, partial
+from types import MappingProxyType
 
-try:
-    from pkg_resources import load_entry_point
-except:
-    load_entry_point = lambda x: None
+from ama_tk import email_address
+from ama_tk.datetimes import compile_format
+from ama_tk.email_address import resolve_tlds
+from ama_tk.paths import (PATH_NAME_PROFILES, Pathspec, is_creatable,
+                           is_valid_path_name, path_info)
+from ama_tk.spec import Spec, compile_spec, split_spec
 
-import re
-try:
-    import pyisemail
-    PYISEMAIL = True
-except ImportError:
-    PYISEMAIL = False
 
+@lru_cache(maxsize=None)
+def _translation():
+    import gettext
 
-if sys.version_info < (3, 0):
-    gettext.install('ama', unicode=True) #pylint: disable=unexpected-keyword-arg
-else:
-    gettext.install('ama')
+    return gettext.translation('ama', fallback=True)
+
+
+def _(message):
+    """Translate a message. The translations are only loaded when the first
+    message is needed, which for most validators means the first failure.
+    """
+
+    return _translation().gettext(message)
+
+
+@lru_cache(maxsize=None)
+def _pyisemail():
+    """Import :mod:`pyisemail` on first use, returning None if it isn't
+    installed.
+    """
+
+    try:
+        import pyisemail
+    except ImportError:
+        return None
+
+    return pyisemail
+
+
+def load_entry_point(reference):
+    """Load the object referred to by a ``module:attr`` entry point
+    reference.
+    """
+
+    from importlib.metadata import EntryPoint
+
+    from ama_tk.discovery import ENTRY_POINT_GROUP
+
+    return EntryPoint(reference, reference, ENTRY_POINT_GROUP).load()
 
 
 DEFAULT_TIME_FORMAT = '%H:%M'
@@ -68,21 +99,15 @@ DEFAULT_DATE_FORMAT = '%Y-%m-%d'
 
 if sys.version_info >= (3, 0):
     str_type = str
-    csv.register_dialect('ama', delimiter='|')
 else:
     str_type = basestring
-    csv.register_dialect('ama', delimiter=b'|')
 
 
 def str_to_elems(string):
     if sys.version_info < (3, 0) and isinstance(string, basestring):
         string = string.decode('UTF-8')
 
-    ds = StringIO(string)
-    reader = csv.reader(ds, dialect=csv.get_dialect('ama'))
-    for row in reader:
-        for elem in row:
-            yield elem
+    return iter(split_spec(string))
 
 
 def str_to_kwargs(string, allowed=None):
@@ -95,6 +120,86 @@ def str_to_kwargs(string, allowed=None):
     return kwargs
 
 
+def _to_int(value):
+    """Convert a ``min`` or ``max`` argument to an :class:`int`, refusing to
+    truncate a float.
+    """
+
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(_('%s is not an integer') % value)
+
+    return int(value)
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize')
+
+
+class LRUCache(object):
+    """A bounded, thread safe LRU cache used to share the validators created
+    by :func:`get_validator` and the compiled regular expressions used by the
+    ``re`` validator.
+
+    Validators are closures without any per call state so a single instance
+    can be shared between all the questions that use the same type and spec.
+
+    :param maxsize: The maximum number of items to keep.
+    :type maxsize:  int
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, factory):
+        """Return the item stored under `key` creating it by calling
+        `factory` if it is not already in the cache.
+        """
+
+        with self._lock:
+            try:
+                func = self._cache[key]
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return func
+            except KeyError:
+                self._misses += 1
+
+        # Create the item outside the lock so that a slow factory
+        # doesn't hold up lookups from other threads.
+        func = factory()
+
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+
+            self._cache[key] = func
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+        return func
+
+    def clear(self):
+        """Remove all items from the cache and reset the counters."""
+
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self):
+        """Return a :class:`CacheInfo` tuple containing the cache statistics."""
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self.maxsize, len(self._cache))
+
+
 def NonEmpty(*args, **kwargs):
     """Create a validator that checks that any value is provided"""
 
@@ -144,7 +249,7 @@ def Str(*args, **kwargs):
                  The string ``nonempty``
                      a string of length greater than 1 passes
 
-                 A string of `argument=value` pairs separated by commas.
+                 A string of `argument=value` pairs separated by ``|``.
                      Checks the string matches based on the arguments specified
 
                      The following arguments can be specified.
@@ -152,12 +257,18 @@ def Str(*args, **kwargs):
                          | ``min`` - The minimum number of characters
                          | ``max`` - The maximum number of characters
 
-                     e.g. "min=3,max=6" means the string must be between 3 and 6
+                     e.g. "min=3|max=6" means the string must be between 3 and 6
                      characters long.
     :type spec:  str
     """
 
-    def validate(value, **kwargs):
+    if args and args[0] == 'nonempty':
+        return NonEmpty()
+
+    min_ = _to_int(kwargs['min']) if 'min' in kwargs else None
+    max_ = _to_int(kwargs['max']) if 'max' in kwargs else None
+
+    def validate(value):
         if value is None or value=='':
             return ''
         
@@ -168,22 +279,15 @@ def Str(*args, **kwargs):
 
         length = len(value)
 
-        if 'min' in kwargs:
-            min_ = int(kwargs['min'])
-            if length < min_:
-                raise ValueError(_('String must be at least %d characters') % min_)
+        if min_ is not None and length < min_:
+            raise ValueError(_('String must be at least %d characters') % min_)
 
-        if 'max' in kwargs:
-            max_ = int(kwargs['max'])
-            if length > max_:
-                raise ValueError(_('String must be a maximum of %d characters') % max_)
+        if max_ is not None and length > max_:
+            raise ValueError(_('String must be a maximum of %d characters') % max_)
 
         return value
 
-    if args and args[0] == 'nonempty':
-        return NonEmpty()
-    else:
-        return partial(validate, **kwargs)
+    return validate
 
 
 def Int(*args, **kwargs):
@@ -197,47 +301,43 @@ def Int(*args, **kwargs):
                       Anything that is an integer passes. e.g. 1 and "1" are
                       valid integers but 1.2, "1.2" or "chas" are not.
 
-                 A string of `argument=value` pairs separated by commas.
+                 A string of `argument=value` pairs separated by ``|``.
                      Alters how the integer is validated. The following arguments
                      can be specified.
 
                          | ``min`` - The minimum value
                          | ``max`` - The maximum value
 
-                     e.g. "min=3,max=6" means the value must be between 3 and 6.
+                     e.g. "min=3|max=6" means the value must be between 3 and 6.
     :type spec:  str
     """
 
-    def validate(value, **kwargs):
-        msg = _('Invalid integer value')
+    min_ = _to_int(kwargs['min']) if 'min' in kwargs else None
+    max_ = _to_int(kwargs['max']) if 'max' in kwargs else None
+    decimal = str(kwargs.get('decimal', '.'))
 
-        if isinstance(value, float):
-            raise TypeError(msg)
+    def validate(value):
+        if type(value) is not int:
+            if isinstance(value, float):
+                raise TypeError(_('Invalid integer value'))
 
-        if isinstance(value, str_type):
-            decimal = kwargs.get('decimal', '.')
+            if isinstance(value, str_type) and decimal in value:
+                raise ValueError(_('Invalid integer value'))
 
-            if decimal in value:
-                raise ValueError(msg)
+            try:
+                value = int(value)
+            except:
+                raise ValueError(_('Invalid integer value'))
 
-        try:
-            value = int(value)
-        except:
-            raise ValueError(msg)
+        if min_ is not None and value < min_:
+            raise ValueError('Integer value less than minimum %d' % min_)
 
-        if 'min' in kwargs:
-            min_ = int(kwargs['min'])
-            if value < min_:
-                raise ValueError('Integer value less than minimum %d' % min_)
-
-        if 'max' in kwargs:
-            max_ = int(kwargs['max'])
-            if value > max_:
-                raise ValueError('Integer value greater than maximum %d' % max_)
+        if max_ is not None and value > max_:
+            raise ValueError('Integer value greater than maximum %d' % max_)
 
         return value
 
-    return partial(validate, **kwargs)
+    return validate
 
 
 def Float(*args, **kwargs):
@@ -251,7 +351,7 @@ def Float(*args, **kwargs):
                       Anything that is a float passes. e.g. 1.2 and "1.2" are
                       valid floats but 1, "1" or "dave" are not.
 
-                 A string of `argument=value` pairs separated by commas.
+                 A string of `argument=value` pairs separated by ``|``.
                      Alters how the float is validated. The following arguments
                      can be specified.
 
@@ -260,43 +360,41 @@ def Float(*args, **kwargs):
                          | ``decimal`` - The character to consider as the decimal separator
                          | ``nocoerce`` - Disable coercing int to float
 
-                     e.g. "min=3.1,max=6.0" means the value must be between
+                     e.g. "min=3.1|max=6.0" means the value must be between
                      3.1 and 6.0; "decimal=\\\\," means that "33,234" is a valid float.
     :type spec:  str
     """
 
-    def validate(value, **kwargs):
-        msg = _('Invalid floating point value')
+    min_ = float(kwargs['min']) if 'min' in kwargs else None
+    max_ = float(kwargs['max']) if 'max' in kwargs else None
+    decimal = str(kwargs.get('decimal', '.'))
+    nocoerce = 'nocoerce' in kwargs
 
-        if 'nocoerce' in kwargs and isinstance(value, int):
-            raise TypeError(msg)
+    def validate(value):
+        if type(value) is not float:
+            if nocoerce and isinstance(value, int):
+                raise TypeError(_('Invalid floating point value'))
 
-        if isinstance(value, str_type):
-            decimal = kwargs.get('decimal', '.')
+            if isinstance(value, str_type):
+                if nocoerce and decimal not in value:
+                    raise ValueError(_('Invalid floating point value'))
+                elif decimal != '.':
+                    value = value.replace(decimal, '.')
 
-            if 'nocoerce' in kwargs and decimal not in value:
-                raise ValueError(msg)
-            elif decimal != '.':
-                value = value.replace(decimal, '.')
+            try:
+                value = float(value)
+            except:
+                raise ValueError(_('Invalid floating point value'))
 
-        try:
-            value = float(value)
-        except:
-            raise ValueError(msg)
-
-        if 'min' in kwargs:
-            min_ = float(kwargs['min'])
-            if value < min_:
-                raise ValueError('Float value less than minimum %f' % min_)
+        if min_ is not None and value < min_:
+            raise ValueError('Float value less than minimum %f' % min_)
 
-        if 'max' in kwargs:
-            max_ = float(kwargs['max'])
-            if value > max_:
-                raise ValueError('Float value greater than maximum %f' % max_)
+        if max_ is not None and value > max_:
+            raise ValueError('Float value greater than maximum %f' % max_)
 
         return value
 
-    return partial(validate, **kwargs)
+    return validate
 
 
 def Number(*args, **kwargs):
@@ -309,7 +407,7 @@ def Number(*args, **kwargs):
                  None
                       Anything that is a number passes.
 
-                 A string of `argument=value` pairs separated by commas.
+                 A string of `argument=value` pairs separated by ``|``.
                      Check s the integer matches based on the arguments specified
 
                      The following arguments can be specified.
@@ -318,36 +416,33 @@ def Number(*args, **kwargs):
                          | ``max`` - The maximum value
                          | ``decimal`` - The character to consider as the decimal separator
 
-                     e.g. "min=3,max=6" means the value must be between 3 and 6.
+                     e.g. "min=3|max=6" means the value must be between 3 and 6.
     :type spec:  str
     """
 
-    def validate(value, **kwargs):
-        msg = _('Invalid number')
+    min_ = float(kwargs['min']) if 'min' in kwargs else None
+    max_ = float(kwargs['max']) if 'max' in kwargs else None
+    decimal = str(kwargs.get('decimal', '.'))
 
-        if isinstance(value, str_type):
-            decimal = kwargs.get('decimal', '.')
-            if decimal != '.':
+    def validate(value):
+        if type(value) is not float:
+            if decimal != '.' and isinstance(value, str_type):
                 value = value.replace(decimal, '.')
 
-        try:
-            value = float(value)
-        except ValueError:
-            raise ValueError(msg)
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(_('Invalid number'))
 
-        if 'min' in kwargs:
-            min_ = float(kwargs['min'])
-            if value < min_:
-                raise ValueError('Float value less than minimum %d' % min_)
+        if min_ is not None and value < min_:
+            raise ValueError('Float value less than minimum %d' % min_)
 
-        if 'max' in kwargs:
-            max_ = float(kwargs['max'])
-            if value > max_:
-                raise ValueError('Float value greater than maximum %d' % max_)
+        if max_ is not None and value > max_:
+            raise ValueError('Float value greater than maximum %d' % max_)
 
         return value
 
-    return partial(validate, **kwargs)
+    return validate
 
 
 def Bool(*args, **kwargs):
@@ -372,29 +467,114 @@ def Bool(*args, **kwargs):
     return validate
 
 
+regex_cache = LRUCache(maxsize=2048)
+
+_regex_flags = {
+    'a': 'ASCII',
+    'i': 'IGNORECASE',
+    'l': 'LOCALE',
+    'm': 'MULTILINE',
+    's': 'DOTALL',
+    'x': 'VERBOSE',
+}
+
+
+def compile_regex(pattern, flags='', engine=None):
+    """Compile a regular expression, sharing the result with every other
+    caller which uses the same pattern and flags.
+
+    :param pattern: The regular expression
+    :type pattern:  str
+    :param flags: A string of single letter flags as used in an inline
+                  ``(?aimsx)`` group.
+    :type flags:  str
+    :param engine: The module to compile the pattern with; :mod:`re` or
+                   the third party :mod:`regex` module.
+    :raises ValueError: If the pattern or the flags are invalid
+    """
+
+    engine = engine or re
+
+    def factory():
+        value = 0
+        for letter in flags:
+            try:
+                value |= getattr(engine, _regex_flags[letter])
+            except KeyError:
+                raise ValueError('Unknown regular expression flag %s' % letter)
+
+        try:
+            return engine.compile(pattern, value)
+        except engine.error as exc:
+            raise ValueError('Invalid regular expression %s: %s' % (pattern, exc))
+
+    return regex_cache.get((engine.__name__, pattern, flags), factory)
+
+
+def regex_cache_info():
+    """Return the hit, miss and eviction counts for the compiled regular
+    expressions.
+    """
+
+    return regex_cache.info()
+
+
 def Regex(*args, **kwargs):
     """Create a validator that checks that the value matches a regular
     expression.
+
+    The regular expression is compiled once and shared between all the
+    validators which use it.
+
+    :param spec: The regular expression followed by any of these options
+
+                     | ``fullmatch=1`` - The whole value must match
+                     | ``flags=`` - Letters from ``aimsx`` e.g. ``flags=im``
+                     | ``timeout=`` - The maximum number of seconds to spend
+                       matching. Requires the :mod:`regex` module.
+    :type spec:  str
     """
     # if no regex provided just check that the value can be converted to a string
     if len(args) == 0:
         return lambda value: str(value)
 
-    def validate(value, **kwargs):
-        msg = _('Please enter a string which matches the regex')
+    regex = args[0]
+    if not regex:
+        return lambda value: value
 
-        regex = kwargs.pop('regex', None)
-        if regex:
-            m = re.match(regex, value)
-            if m is not None:
-                return value
-            else:
-                raise ValueError('%s %s' % (msg, regex))
-        else:
-            return value
+    flags = str(kwargs.get('flags', ''))
+    timeout = kwargs.get('timeout', None)
+    engine = None
+
+    if timeout:
+        try:
+            import regex as engine
+        except ImportError:
+            warnings.warn('The regex module is required to use a timeout')
+            timeout = None
+
+    compiled = compile_regex(regex, flags, engine)
+
+    if _to_bool(kwargs.get('fullmatch', False)):
+        match = compiled.fullmatch
+    else:
+        match = compiled.match
 
-    kwargs['regex'] = args[0]
-    return partial(validate, **kwargs)
+    if timeout:
+        match = partial(match, timeout=float(timeout))
+
+    def validate(value):
+        try:
+            m = match(value)
+        except TimeoutError:
+            raise ValueError(_('Timed out matching the regex %s') % regex)
+
+        if m is None:
+            raise ValueError('%s %s' % (_('Please enter a string which matches the regex'), regex))
+
+        return value
+
+    return validate
 
 
 def Path(*args, **kwargs):
@@ -414,7 +594,12 @@ def Path(*args, **kwargs):
             is a path that is not empty
 
         ``new``
-            is a path that does not exist and is a valid name for a path
+            is a path that does not exist and is a valid name for a path.
+
+            The name is checked against the rules for the current platform
+            without creating anything. ``profile=posix`` or
+            ``profile=windows`` selects the rules to use and ``access=1``
+            also checks that the parent directory is writable.
 
         :samp:`{pathspec}`
             is a valid path name that contains files that conform to `pathspec`
@@ -423,17 +608,25 @@ def Path(*args, **kwargs):
             leading ``+`` indicates that the path must include a
             file that matches the glob and ``-`` indicates that it
             must not include files that match the glob. Multiple
-            pathspecs can be specified separated by commas.
+            pathspecs can be specified separated by ``|``.
     :type spec:  str
+
+    The existence and emptiness checks can be cached by calling
+    :func:`ama_tk.paths.enable_path_cache`.
     """
 
+    profile = kwargs.get('profile', None)
+    if profile is not None and profile not in PATH_NAME_PROFILES:
+        raise ValueError(_('Unknown path name profile %s') % profile)
+
+    check_access = _to_bool(kwargs.get('access', False))
+
     def validate_path_existing(value):
         """Validate that path exists"""
 
         msg1 = _('Path does not exist.')
 
-        is_dir = os.path.exists(value) and os.path.isdir(value)
-        if not is_dir:
+        if not path_info(value).is_dir:
             raise ValueError(msg1)
         return value
 
@@ -442,37 +635,31 @@ def Path(*args, **kwargs):
 
         msg1 = _('Path already exists.')
         msg2 = _('Invalid path name.')
+        msg3 = _('Path cannot be created.')
 
         if value == '':
             return ''
 
-        if os.path.isdir(value):
+        if path_info(value).is_dir:
             raise ValueError(msg1)
 
-        if os.path.isabs(value):
-            dummy, p = os.path.splitdrive(value)
-        else:
-            p = value
+        if not is_valid_path_name(value, profile):
+            raise ValueError(msg2)
 
-        if p[0] == '\\' or p[0] == '/':
-            p = p[1:]
+        if check_access and not is_creatable(value):
+            raise ValueError(msg3)
 
-        try:
-            tf = tempfile.mkdtemp(prefix=p)
-            shutil.rmtree(tf)
-            return value
-        except OSError:
-            raise ValueError(msg2)
+        return value
 
     def validate_path_empty(value):
         msg1 = _('Path does not exist.')
         msg2 = _('Path should be empty.')
 
-        is_dir = os.path.exists(value) and os.path.isdir(value)
-        if not is_dir:
+        info = path_info(value, need_empty=True)
+        if not info.is_dir:
             raise ValueError(msg1)
 
-        if len(os.listdir(value)) != 0:
+        if info.empty is not True:
             raise ValueError(msg2)
         return value
 
@@ -480,50 +667,43 @@ def Path(*args, **kwargs):
         msg1 = _('Path does not exist.')
         msg2 = _('Path should contain files.')
 
-        is_dir = os.path.exists(value) and os.path.isdir(value)
-        if not is_dir:
+        info = path_info(value, need_empty=True)
+        if not info.is_dir:
             raise ValueError(msg1)
 
-        if len(os.listdir(value)) == 0:
+        if info.empty is not False:
             raise ValueError(msg2)
         return value
 
     def validate_path_with_spec(*args):
         included = []
         not_included = []
-        for elem in str_to_elems(args[0]):
+        for elem in args:
             if elem.startswith('+'):
                 included.append(elem[1:].strip('"'))
             elif elem.startswith('-'):
                 not_included.append(elem[1:].strip('"'))
 
+        pathspec = Pathspec(included, not_included)
+
         def validate(value):
-            msg_start = _('Path %s')
-            msg_should_contain = _('should contain files matching %s')
-            msg_should_not_contain = _('should not contain files matching %s')
-
-            not_found = []
-            for spec in included:
-                if len(glob.glob(os.path.join(value, spec))) == 0:
-                    not_found.append(spec)
-
-            found = []
-            for spec in not_included:
-                if len(glob.glob(os.path.join(value, spec))) != 0:
-                    found.append(spec)
-
-            found_count = len(found)
-            not_found_count = len(not_found)
-            if found_count != 0 or not_found_count != 0:
-                msg_elem = [msg_start % value]
-                if not_found_count > 0:
-                    msg_elem.append(msg_should_contain % ','.join(included))
-
-                if found_count > 0:
-                    if not_found_count > 0:
+            match = pathspec.scan(value)
+
+            not_found = [p for p in included if p not in match.included]
+            found = match.excluded
+
+            if found or not_found:
+                msg_elem = [_('Path %s') % value]
+                if not_found:
+                    msg_elem.append(_('should contain files matching %s') %
+                                    ','.join(not_found))
+
+                if found:
+                    if not_found:
                         msg_elem.append(_('and'))
 
-                    msg_elem.append(msg_should_not_contain % ','.join(not_included))
+                    msg_elem.append(_('should not contain files matching %s') %
+                                    ','.join(found))
 
                 msg = ' '.join(msg_elem)
                 raise ValueError(msg)
@@ -559,9 +739,9 @@ def Date(*args, **kwargs):
     else:
         spec = args[0]
 
-    def validate(value):
-        msg = _('Invalid date for format %s')
+    fmt = compile_format(spec)
 
+    def validate(value):
         if value is None or value == '':
             return ''
 
@@ -572,14 +752,9 @@ def Date(*args, **kwargs):
             return value
 
         try:
-            d = datetime.strptime(value, spec)
-            return d.date()
-        except:
-            f = spec
-            format_conv = {'%Y': 'YYYY', '%y': 'YY', '%m': 'MM', '%d': 'DD'}
-            for k, v in format_conv.items():
-                f = f.replace(k, v)
-            raise ValueError(msg % spec)
+            return fmt.date(value)
+        except Exception:
+            raise ValueError(_('Invalid date for format %s') % fmt.hint)
 
     return validate
 
@@ -599,9 +774,9 @@ def Time(*args, **kwargs):
     else:
         spec = args[0]
 
-    def validate(value):
-        msg = _('Invalid time for format %s')
+    fmt = compile_format(spec)
 
+    def validate(value):
         if value is None or value == '':
             return ''
 
@@ -609,14 +784,9 @@ def Time(*args, **kwargs):
             return value
 
         try:
-            d = datetime.strptime(value, spec)
-            return d.time()
-        except:
-            f = spec
-            format_conv = {'%H': 'hh', '%M': 'mm', '%S': 'ss'}
-            for k, v in format_conv.items():
-                f = f.replace(k, v)
-            raise ValueError(msg % spec)
+            return fmt.time(value)
+        except Exception:
+            raise ValueError(_('Invalid time for format %s') % fmt.hint)
 
     return validate
 
@@ -659,35 +829,157 @@ def Color(*args, **kwargs):
         return validate_rgb
 
 
+def _to_bool(value):
+    if isinstance(value, str_type):
+        return value.lower() in ('1', 'true', 'yes', 'y')
+
+    return bool(value)
+
+
 def Email(*args, **kwargs):
     """Create a validator that checks that the value is a valid email address.
 
     If the :mod:`pyisemail` module is available then that is used to validate
     the email address otherwise a regular expression is used (which may produce
     false positives.)
+
+    :param spec: Any of the following
+
+                     | ``re`` - Always use the regular expression
+                     | ``tlds=builtin`` - Only accept the built in list of
+                       top level domains
+                     | ``tlds=filename`` - Only accept the top level domains
+                       listed in a file
+                     | ``check_dns=1``, ``allow_gtld=1`` - Options passed to
+                       :mod:`pyisemail`
+    :type spec:  str
     """
+
+    tlds = resolve_tlds(kwargs.get('tlds', None))
+
+    pyisemail = _pyisemail() if 're' not in args else None
+
+    if pyisemail is not None:
+        options = {}
+        for option in ('check_dns', 'allow_gtld'):
+            if option in kwargs:
+                options[option] = _to_bool(kwargs[option])
+
+        is_email = partial(pyisemail.is_email, **options)
+    else:
+        is_email = partial(email_address.is_email, tlds=tlds)
+        tlds = None
+
     def validate(value):
-        msg = _('Invalid email address')
+        if not is_email(value):
+            raise ValueError(_('Invalid email address'))
 
-        if PYISEMAIL and 're' not in args:
-            kwargs = str_to_kwargs(args[0])
-            match = pyisemail.is_email(value, **kwargs)
-        else:
-            match = re.match(r'^[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,4}$',
-                         value,
-                         flags=re.IGNORECASE)
+        if tlds is not None and value.rpartition('.')[2].lower() not in tlds:
+            raise ValueError(_('Invalid email address'))
 
-        if not match:
-            raise ValueError(msg)
-        else:
-            return value
+        return value
 
     return validate
 
 
-entry_point_re = re.compile(r'\w+(\.\w)?\:\w+(\.\w)?')
+entry_point_re = re.compile(r'\w+(\.\w+)*:\w+(\.\w+)*')
+
+class ValidatorRegistry(Mapping):
+    """A mapping of validator names to the factories which create them.
+
+    Lookups don't take a lock; the factories are held in a dictionary which
+    is never changed once published and updates replace it with a modified
+    copy under a lock. :meth:`snapshot` returns a consistent, read only view.
+
+    :meth:`override` temporarily replaces factories for the current thread
+    or asyncio task only, which allows different validators to be used while
+    handling a single request.
+
+    Factories must return reentrant validators i.e. closures which don't
+    modify any shared state, so that one validator can be used from several
+    threads at once. All the built in validators follow this rule.
+    """
+
+    def __init__(self, factories=None):
+        self._lock = threading.Lock()
+        self._factories = dict(factories or {})
+        self._overrides = contextvars.ContextVar('ama_tk_validator_overrides',
+                                                 default=None)
+
+    def __getitem__(self, name):
+        overrides = self._overrides.get()
+        if overrides is not None and name in overrides:
+            return overrides[name]
+
+        return self._factories[name]
+
+    def __contains__(self, name):
+        try:
+            self[name]
+            return True
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __len__(self):
+        return len(self.snapshot())
+
+    def __setitem__(self, name, factory):
+        self.register(name, factory)
+
+    def __delitem__(self, name):
+        self.unregister(name)
+
+    def register(self, name, factory):
+        """Register a validator factory under `name`"""
+
+        with self._lock:
+            factories = dict(self._factories)
+            factories[name] = factory
+            self._factories = factories
+
+    def unregister(self, name):
+        """Remove the factory registered under `name`"""
+
+        with self._lock:
+            factories = dict(self._factories)
+            del factories[name]
+            self._factories = factories
+
+    def snapshot(self):
+        """Return a read only view of the factories, including any overrides
+        active in the current context.
+        """
 
-validators = {
+        factories = self._factories
+        overrides = self._overrides.get()
+        if overrides:
+            factories = dict(factories)
+            factories.update(overrides)
+
+        return MappingProxyType(factories)
+
+    @contextmanager
+    def override(self, **factories):
+        """A context manager which replaces validator factories in the
+        current context only e.g. ::
+
+            with validators.override(email=StrictEmail):
+                validate = get_validator('email')
+        """
+
+        merged = dict(self._overrides.get() or {})
+        merged.update(factories)
+        token = self._overrides.set(MappingProxyType(merged))
+        try:
+            yield self
+        finally:
+            self._overrides.reset(token)
+
+
+validators = ValidatorRegistry({
     'nonempty': NonEmpty,
     'constant': Constant,
     'str': Str,
@@ -703,55 +995,236 @@ validators = {
     're': Regex,
     'password': Str,
     'email': Email,
+})
+
+
+# The relative cost of running each validator, used to run cheap checks before
+# expensive ones. Validators at or above FILESYSTEM_COST touch the disk.
+FILESYSTEM_COST = 100
+DEFAULT_COST = 50
+
+validator_costs = {
+    'constant': 0,
+    'nonempty': 1,
+    'bool': 1,
+    'yesno': 1,
+    'str': 2,
+    'password': 2,
+    'int': 2,
+    'float': 2,
+    'number': 2,
+    'color': 3,
+    're': 5,
+    'date': 8,
+    'time': 8,
+    'email': 10,
+    'path': FILESYSTEM_COST,
 }
 
 
+def validator_cost(validator):
+    """Return the estimated relative cost of running a validator. Unknown
+    validators, such as those provided by other packages, are assumed to be
+    more expensive than any built in check which doesn't touch the disk. The
+    cost of a pipeline is the sum of the cost of its stages.
+    """
+
+    if isinstance(validator, list):
+        return validator_costs['nonempty']
+
+    if is_pipeline(validator):
+        return sum(validator_cost(name) for name, _spec in
+                   pipeline_stages(validator))
+
+    return validator_costs.get(validator, DEFAULT_COST)
+
+
+PIPELINE_SEPARATOR = '&'
+
+text_validators = frozenset([
+    'nonempty', 'str', 'password', 're', 'email', 'path', 'color', 'date',
+    'time',
+])
+"""The validators which check the text of an answer when they're used after
+the first stage of a pipeline; the other stages check the first stage's
+result."""
+
+
+def is_pipeline(validator):
+    """Return True if `validator` combines several validators e.g.
+    ``str & re & nonempty``
+    """
+
+    return isinstance(validator, str_type) and PIPELINE_SEPARATOR in validator
+
+
+def pipeline_stages(validator, spec=None):
+    """Split a pipeline into a list of ``(name, spec)`` stages.
+
+    `spec` is either a list containing a specification for each stage or a
+    single specification which is used for the first stage only.
+    """
+
+    names = [name.strip() for name in validator.split(PIPELINE_SEPARATOR)]
+    if not all(names):
+        raise ValueError(_('Empty stage in validator pipeline %s') % validator)
+
+    if isinstance(spec, (list, tuple)):
+        if len(spec) != len(names):
+            raise ValueError(
+                _('Validator pipeline %s has %d stages but %d specifications')
+                % (validator, len(names), len(spec)))
+        specs = list(spec)
+    else:
+        specs = [spec] + [None] * (len(names) - 1)
+
+    return list(zip(names, specs))
+
+
+def Pipeline(*stages):
+    """Create a validator which combines several validators.
+
+    :param stages: ``(cost, validate, text)`` tuples. The first stage
+                   converts the value and its result is returned, the other
+                   stages only check the value.
+
+    The converter is passed the original value and is run once. A check whose
+    `text` flag is True is passed the value as text (``str(value)``, or ``''``
+    for None) and runs before the converter if it is cheaper. Any other check
+    is passed the converter's result and so always runs after it. The checks
+    are run cheapest first, stopping at the first one to fail.
+    """
+
+    convert_cost, convert = stages[0][:2]
+    checks = sorted(stages[1:], key=lambda stage: stage[0])
+    before = tuple(check for cost, check, text in checks
+                   if text and cost < convert_cost)
+    after = tuple((check, text) for cost, check, text in checks
+                  if not text or cost >= convert_cost)
+    needs_text = any(text for _cost, _check, text in checks)
+
+    def validate(value):
+        if needs_text:
+            text = '' if value is None else str(value)
+
+        for check in before:
+            check(text)
+
+        result = convert(value)
+
+        for check, wants_text in after:
+            check(text if wants_text else result)
+
+        return result
+
+    return validate
+
+
+def available_validators():
+    """Return the names of all the validators which can be passed to
+    :func:`get_validator` mapped to the ``module:attr`` reference of their
+    factory. Validators provided by other packages are listed without being
+    imported.
+    """
+
+    from ama_tk.discovery import validator_index
+
+    available = dict(validator_index())
+    for name, func in validators.items():
+        available[name] = '%s:%s' % (func.__module__, func.__name__)
+
+    return available
+
+
 def spec_to_args(spec):
-    args = []
-    kwargs = {}
-    if spec:
-        for elem in str_to_elems(spec):
-            pos = elem.find('=')
-            if pos == -1:
-                args.append(elem)
-            else:
-                while True:
-                    if elem[pos - 1] != '\\':
-                        break
-
-                    pos = elem.find('=', pos + 1)
-
-                    if pos == -1:
-                        break
-
-                if pos != -1:
-                    key = elem[:pos]
-                    value = elem[pos + 1:]
-                    kwargs[key] = value
-                else:
-                    args.append(elem)
-    return args, kwargs
+    """Convert a specification into a list of positional arguments and a
+    dictionary of keyword arguments.
+    """
+
+    spec = compile_spec(spec)
+    return list(spec.args), dict(spec.kwargs)
+
+
+validator_cache = LRUCache()
+
+
+def clear_validator_cache():
+    """Clear the cache of validators created by :func:`get_validator`"""
+
+    validator_cache.clear()
+
+
+def validator_cache_info():
+    """Return the hit, miss and eviction counts for the validator cache."""
+
+    return validator_cache.info()
+
+
+def _find_factory(validator):
+    factory = validators.get(validator, None)
+    if factory is None:
+        from ama_tk.discovery import validator_index
+
+        reference = validator_index().get(validator, None)
+        if reference is None:
+            raise KeyError(validator)
+
+        factory = load_entry_point(reference)
+        validators.register(validator, factory)
+
+    return factory
+
+
+def _create_validator(factory, spec):
+    spec = compile_spec(spec)
+    return factory(*spec.args, **spec.kwargs)
 
 
 def get_validator(validator, spec=None):
     """Get a validation function
 
+    `validator` is either the name of a built in validator, the name of a
+    validator provided by another package through the ``ama.validators``
+    entry point group (see :mod:`ama_tk.discovery`) or a ``module:attr``
+    reference to a validation function.
+
+    Validators are cached so asking for the same `validator` and `spec`
+    returns the same function. The cache is keyed on the factory which
+    creates the validator so overrides made with
+    :meth:`ValidatorRegistry.override` are respected.
+
+    Several validators can be combined into a pipeline by separating their
+    names with ``&`` e.g. ``str & re & nonempty``, in which case `spec` is a
+    list with a specification for each validator (see :func:`Pipeline`).
+
     :param validator: The name of the validator to create
     :type validator:  str
     :param spec: A specification to modify how the validator works
     :type spec:  str
+    :raises TypeError: If `spec` is not a string, or a list of strings for a
+                       pipeline
     """
-    
-    if not entry_point_re.match(validator):
-        func = validators[validator]
 
-        args, kwargs = spec_to_args(spec)
-
-        return func(*args, **kwargs)
-    else:
-        if validator in validators:
-            return validators[validator]
-        else:
+    if is_pipeline(validator):
+        stages = tuple(
+            (validator_cost(name), get_validator(name, stage_spec),
+             name in text_validators)
+            for name, stage_spec in pipeline_stages(validator, spec)
+        )
+        return validator_cache.get((Pipeline, stages), partial(Pipeline, *stages))
+
+    if entry_point_re.match(validator):
+        func = validators.get(validator, None)
+        if func is None:
             func = load_entry_point(validator)
-            validators[validator] = func
-            return func
+            validators.register(validator, func)
+        return func
+
+    if spec is not None and not isinstance(spec, (str_type, Spec)):
+        raise TypeError(
+            _('The specification for the %s validator must be a string, not %s')
+            % (validator, type(spec).__name__))
+
+    factory = _find_factory(validator)
+    return validator_cache.get((factory, spec),
+                               partial(_create_validator, factory, spec))
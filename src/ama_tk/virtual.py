@@ -0,0 +1,394 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""A scrolling form which only creates widgets for the visible questions.
+
+Normally :class:`~ama_tk.asker.TkAsker` creates a label, an entry and an
+information label for every question. In virtual mode
+(``TkAsker(data, virtual=True)``) the state of each question is kept in a
+:class:`VirtualQuestion` and a :class:`VirtualForm` creates just enough rows of
+widgets to fill its window, plus a few rows of overscan above and below. As the
+form is scrolled the rows are bound to the questions which have scrolled into
+view so the number of widgets stays the same however many questions there are.
+
+Questions are displayed with a text entry, or a drop down list for the
+``bool`` and ``yesno`` types and for lists of choices. Help text is shown
+below the form when the pointer is over a question's ``?`` marker.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import tkinter as tk
+from tkinter import ttk
+
+from ama.types import Question
+
+from ama_tk.question import QuestionState
+from ama_tk.styles import INFO_LABEL, QUESTION_LABEL, styles_for
+
+_choice_text = {
+    "bool": ("True", "False"),
+    "yesno": ("Yes", "No"),
+}
+
+
+class VirtualQuestion(QuestionState):
+    """The state of a single question displayed by a :class:`VirtualForm`.
+
+    Provides the same interface to :class:`~ama_tk.asker.TkAsker` as
+    :class:`~ama_tk.asker.TkQuestion` without creating any widgets.
+    """
+
+    def __init__(self, asker, index, question: Question):
+        super(VirtualQuestion, self).__init__(asker, question)
+        self.index = index
+
+        if isinstance(self.type, list):
+            self.choices = tuple(str(choice) for choice in self.type)
+        else:
+            self.choices = _choice_text.get(self.type, None)
+
+        # The row of widgets the question is displayed in, if it's visible
+        self.row = None
+
+        self.text = ""
+        self._set_initial_value()
+
+    def _read(self):
+        return self.text
+
+    def _write(self, value, validated, valid):
+        if valid:
+            self._set_text(self._format(value, validated))
+        else:
+            self._set_text(str(value))
+
+    def _format(self, value, validated):
+        if self.choices is not None and not isinstance(self.type, list):
+            return self.choices[0] if validated else self.choices[1]
+        elif isinstance(value, str):
+            return value
+        else:
+            return str(validated)
+
+    def _set_text(self, text):
+        self.text = text
+        self._value_cached = False
+        if self.row is not None:
+            self.row.refresh()
+
+    def _show_valid(self):
+        if self.row is not None:
+            self.row.refresh_state()
+
+    def _show_edited(self):
+        if self.row is not None:
+            self.row.refresh_state()
+
+    def edit(self, text):
+        """Respond to the text being changed in the question's row."""
+
+        self.text = text
+        self._value_cached = False
+        super(VirtualQuestion, self).edit(text)
+
+
+class _Row(object):
+    """A row of widgets which displays whichever question it's bound to."""
+
+    def __init__(self, form):
+        self.form = form
+        self.question = None
+        self.widget = None
+        self._binding = False
+
+        # The question being edited, which is checked when the focus leaves
+        # the row even if the row has been bound to another question since.
+        self._editing = None
+
+        self.frame = ttk.Frame(form.canvas)
+        self.frame.columnconfigure(1, weight=1)
+
+        self.label = ttk.Label(
+            self.frame, style=QUESTION_LABEL, width=form.label_width
+        )
+        self.label.grid(column=0, row=0, sticky=(tk.N, tk.S, tk.W), padx=(0, 5))
+
+        self.var = tk.StringVar(self.frame)
+        self.var.trace_add("write", self._written)
+
+        self.entry = ttk.Entry(self.frame, textvariable=self.var)
+        self.choice = ttk.Combobox(self.frame, textvariable=self.var, state="readonly")
+        self.choice.bind("<<ComboboxSelected>>", self._checked)
+
+        self.info = ttk.Label(self.frame, width=2, anchor=tk.CENTER, style=INFO_LABEL)
+        self.info.grid(column=2, row=0, padx=(3, 0))
+        self.info.bind("<Enter>", self._show_help)
+        self.info.bind("<Leave>", self._hide_help)
+
+        for widget in (self.entry, self.choice):
+            widget.bind("<FocusIn>", self._focused)
+            widget.bind("<FocusOut>", self._focus_lost)
+
+        for widget in (self.frame, self.label, self.entry, self.choice, self.info):
+            form.bind_wheel(widget)
+
+        self.window = form.canvas.create_window(
+            0, 0, anchor=tk.NW, window=self.frame, state=tk.HIDDEN
+        )
+
+    def show(self, question, y):
+        """Bind the row to a question and display it at `y`."""
+
+        if self.question is question:
+            return
+
+        if self.question is not None and self.question.row is self:
+            self.question.row = None
+
+        self.question = question
+        question.row = self
+        self.refresh()
+
+        canvas = self.form.canvas
+        canvas.coords(self.window, 0, y)
+        canvas.itemconfigure(self.window, state=tk.NORMAL)
+
+    def hide(self):
+        if self.question is not None and self.question.row is self:
+            self.question.row = None
+
+        self.question = None
+        self.form.canvas.itemconfigure(self.window, state=tk.HIDDEN)
+
+    def refresh(self):
+        """Display the question's label and text."""
+
+        question = self.question
+
+        self._binding = True
+        try:
+            self.label["text"] = question.message
+
+            if question.choices is not None:
+                widget = self.choice
+                self.choice["values"] = question.choices
+            else:
+                widget = self.entry
+                self.entry["show"] = "*" if question.type == "password" else ""
+
+            if widget is not self.widget:
+                if self.widget is not None:
+                    self.widget.grid_remove()
+                widget.grid(column=1, row=0, sticky=tk.EW)
+                self.widget = widget
+
+            if self.var.get() != question.text:
+                self.var.set(question.text)
+        finally:
+            self._binding = False
+
+        self.refresh_state()
+
+    def refresh_state(self):
+        """Display whether the question is edited and valid."""
+
+        question = self.question
+        styles = self.form.styles
+
+        self.entry["style"] = styles.entry_style(question.edited)
+
+        if question.valid:
+            self.info["text"] = "?" if question.help_text else ""
+        else:
+            self.info["text"] = "!"
+        self.info["style"] = styles.info_style(question.valid)
+
+    def has_focus(self, widget):
+        return widget is self.entry or widget is self.choice
+
+    def _written(self, *args):
+        if not self._binding and self.question is not None:
+            self.question.edit(self.var.get())
+
+    def _checked(self, event=None):
+        if self.question is not None:
+            self.question.check(self.question.text)
+
+    def _focused(self, event=None):
+        self._editing = self.question
+        if self.question is not None:
+            self.form.see(self.question.index)
+
+    def _focus_lost(self, event=None):
+        question = self._editing
+        self._editing = None
+        if question is not None:
+            question.check(question.text)
+
+    def _show_help(self, event=None):
+        if self.question is not None:
+            self.form.help_var.set(self.question.help_text)
+
+    def _hide_help(self, event=None):
+        self.form.help_var.set("")
+
+
+class VirtualForm(ttk.Frame):
+    """A scrolling form which displays a list of :class:`VirtualQuestion`.
+
+    :param master:    The parent widget
+    :param questions: The questions to display
+    :type questions:  list
+    :param rows:      The number of rows to display initially
+    :type rows:       int
+    :param overscan:  The number of rows to bind above and below those which
+                      are visible
+    :type overscan:   int
+    :param label_width: The width of the question labels in characters.
+                        Longer labels are cut off.
+    :type label_width:  int
+    """
+
+    def __init__(
+        self, master, questions, rows=20, overscan=5, label_width=30, **kwargs
+    ):
+        ttk.Frame.__init__(self, master, **kwargs)
+
+        self.questions = questions
+        self.overscan = overscan
+        self._rows = []
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0)
+        self.canvas.grid(column=0, row=0, sticky=(tk.N, tk.S, tk.E, tk.W))
+        self.scrollbar = ttk.Scrollbar(
+            self, orient=tk.VERTICAL, command=self.canvas.yview
+        )
+        self.scrollbar.grid(column=1, row=0, sticky=(tk.N, tk.S))
+        self.canvas.configure(yscrollcommand=self._scrolled)
+
+        self.help_var = tk.StringVar(self)
+        ttk.Label(self, textvariable=self.help_var).grid(
+            column=0, row=1, columnspan=2, sticky=tk.EW
+        )
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.styles = styles_for(self.winfo_toplevel())
+        self.label_width = label_width
+
+        # Measure a row to find the height of every row
+        self._rows.append(_Row(self))
+        self._rows[0].frame.update_idletasks()
+        self.row_height = max(self._rows[0].frame.winfo_reqheight(), 1)
+
+        self.canvas.configure(
+            yscrollincrement=self.row_height,
+            height=min(len(questions), rows) * self.row_height,
+        )
+
+        self.canvas.bind("<Configure>", self._resized)
+        self.bind_wheel(self.canvas)
+
+    def bind_wheel(self, widget):
+        """Scroll the form when the mouse wheel is used over `widget`"""
+
+        widget.bind("<MouseWheel>", self._wheel, add="+")
+        widget.bind("<Button-4>", self._wheel, add="+")
+        widget.bind("<Button-5>", self._wheel, add="+")
+
+    def refresh(self):
+        """Update the form after questions have been added or removed."""
+
+        width = self.canvas.winfo_width()
+        self.canvas.configure(
+            scrollregion=(0, 0, width, len(self.questions) * self.row_height)
+        )
+        for row in self._rows:
+            row.hide()
+        self._layout()
+
+    def see(self, index):
+        """Scroll the form so that the question at `index` is visible."""
+
+        total = len(self.questions) * self.row_height
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        y = index * self.row_height
+
+        if y < top:
+            self.canvas.yview_moveto(y / total)
+        elif y + self.row_height > top + height:
+            self.canvas.yview_moveto((y + self.row_height - height) / total)
+
+    def _resized(self, event):
+        for row in self._rows:
+            self.canvas.itemconfigure(row.window, width=event.width)
+        self.refresh()
+
+    def _scrolled(self, first, last):
+        self.scrollbar.set(first, last)
+        self._layout()
+
+    def _wheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+        return "break"
+
+    def _focused_row(self):
+        try:
+            widget = self.focus_get()
+        except KeyError:
+            return None
+
+        for row in self._rows:
+            if row.has_focus(widget):
+                return row
+
+        return None
+
+    def _layout(self):
+        """Bind the rows to the questions in view, plus the overscan.
+
+        The question at `index` is always displayed by row
+        ``index % len(rows)`` so a question keeps its row, and the focus,
+        while it stays in view.
+        """
+
+        count = len(self.questions)
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+
+        first = max(0, int(top // self.row_height) - self.overscan)
+        last = min(count, int((top + height) // self.row_height) + 1 + self.overscan)
+
+        focused = self._focused_row()
+        focused_question = focused.question if focused is not None else None
+
+        width = self.canvas.winfo_width()
+        while len(self._rows) < last - first:
+            row = _Row(self)
+            self.canvas.itemconfigure(row.window, width=width)
+            self._rows.append(row)
+
+        pool = len(self._rows)
+        shown = set()
+        for index in range(first, last):
+            row = self._rows[index % pool]
+            row.show(self.questions[index], index * self.row_height)
+            shown.add(row)
+
+        for row in self._rows:
+            if row not in shown:
+                row.hide()
+
+        if focused_question is not None and focused_question.row is not focused:
+            # The question has scrolled out of view, or moved to another row
+            # because the pool grew. The row which had the focus checks the
+            # question when it loses the focus.
+            if focused_question.row is not None:
+                focused_question.row.widget.focus_set()
+            else:
+                self.canvas.focus_set()
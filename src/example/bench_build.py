@@ -0,0 +1,90 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Measure how the time to build a form grows with the number of questions.
+
+Forms of 100 to 10,000 questions are built without entering the main loop.
+Every fourth question has a default which refers to the answer before it. The
+time per question should stay roughly constant as the form grows; the script
+fails if the time per question for the largest form is more than
+``MAX_GROWTH`` times that of the smallest.
+"""
+
+import json
+import os.path
+import sys
+import tempfile
+import time
+
+p = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, p)
+
+from ama_tk.asker import TkAsker
+
+SIZES = [100, 1000, 10000]
+MAX_GROWTH = 3.0
+
+
+def question_data(count):
+    questions = []
+    for idx in range(count):
+        question = {
+            "name": "q%d" % idx,
+            "message": "Question %d" % idx,
+            "type": "str",
+            "default": "value %d" % idx,
+        }
+        if idx % 4 == 3:
+            question["default"] = "{q%d}/sub" % (idx - 1)
+
+        questions.append(question)
+
+    return {
+        "title": "Build benchmark",
+        "preamble": "%d questions" % count,
+        "questions": questions,
+    }
+
+
+def build(count, directory):
+    data = question_data(count)
+    filename = os.path.join(directory, "questions%d.json" % count)
+    with open(filename, "w") as fp:
+        json.dump(data, fp)
+
+    with open(filename) as fp:
+        asker = TkAsker(fp)
+
+    start = time.perf_counter()
+    for question in data["questions"]:
+        asker.add_question(question)
+    created = time.perf_counter()
+    asker.resolve_defaults()
+    resolved = time.perf_counter()
+
+    asker._root.destroy()
+    return created - start, resolved - created
+
+
+def main():
+    per_question = []
+    print("%9s %12s %12s %14s" % ("questions", "create (s)", "defaults (s)",
+                                   "per question"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in SIZES:
+            create, resolve = build(count, directory)
+            each = (create + resolve) / count
+            per_question.append(each)
+            print("%9d %12.3f %12.3f %11.1f us" % (count, create, resolve,
+                                                   each * 1e6))
+
+    growth = per_question[-1] / per_question[0]
+    ok = growth <= MAX_GROWTH
+    print("growth in time per question %.2fx (limit %.1fx) %s" % (
+        growth, MAX_GROWTH, "ok" if ok else "FAIL"))
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
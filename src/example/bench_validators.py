@@ -0,0 +1,140 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Measure the per call cost of the numeric validators.
+
+Each validator is timed against the previous implementation which converted
+the bounds and looked up the error message on every call.
+"""
+
+import sys
+import os.path
+import timeit
+from functools import partial
+import gettext
+
+p = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, p)
+
+from ama_tk.validator import get_validator
+
+# The previous implementation used the _ installed by gettext.install('ama'),
+# which without a message catalog is NullTranslations.gettext
+_ = gettext.translation("ama", fallback=True).gettext
+
+
+def legacy_int(value, **kwargs):
+    msg = _("Invalid integer value")
+
+    if isinstance(value, float):
+        raise TypeError(msg)
+
+    if isinstance(value, str):
+        decimal = kwargs.get("decimal", ".")
+
+        if decimal in value:
+            raise ValueError(msg)
+
+    try:
+        value = int(value)
+    except:
+        raise ValueError(msg)
+
+    if "min" in kwargs:
+        min_ = int(kwargs["min"])
+        if value < min_:
+            raise ValueError("Integer value less than minimum %d" % min_)
+
+    if "max" in kwargs:
+        max_ = int(kwargs["max"])
+        if value > max_:
+            raise ValueError("Integer value greater than maximum %d" % max_)
+
+    return value
+
+
+def legacy_float(value, **kwargs):
+    msg = _("Invalid floating point value")
+
+    if "nocoerce" in kwargs and isinstance(value, int):
+        raise TypeError(msg)
+
+    if isinstance(value, str):
+        decimal = kwargs.get("decimal", ".")
+
+        if "nocoerce" in kwargs and decimal not in value:
+            raise ValueError(msg)
+        elif decimal != ".":
+            value = value.replace(decimal, ".")
+
+    try:
+        value = float(value)
+    except:
+        raise ValueError(msg)
+
+    if "min" in kwargs:
+        min_ = float(kwargs["min"])
+        if value < min_:
+            raise ValueError("Float value less than minimum %f" % min_)
+
+    if "max" in kwargs:
+        max_ = float(kwargs["max"])
+        if value > max_:
+            raise ValueError("Float value greater than maximum %f" % max_)
+
+    return value
+
+
+def legacy_number(value, **kwargs):
+    msg = _("Invalid number")
+
+    if isinstance(value, str):
+        decimal = kwargs.get("decimal", ".")
+        if decimal != ".":
+            value = value.replace(decimal, ".")
+
+    try:
+        value = float(value)
+    except ValueError:
+        raise ValueError(msg)
+
+    if "min" in kwargs:
+        min_ = float(kwargs["min"])
+        if value < min_:
+            raise ValueError("Float value less than minimum %d" % min_)
+
+    if "max" in kwargs:
+        max_ = float(kwargs["max"])
+        if value > max_:
+            raise ValueError("Float value greater than maximum %d" % max_)
+
+    return value
+
+
+CASES = [
+    ("int", "min=0|max=1000", legacy_int, {"min": "0", "max": "1000"}, "42"),
+    ("int", "min=0|max=1000", legacy_int, {"min": "0", "max": "1000"}, 42),
+    ("float", "min=0|max=1000", legacy_float, {"min": "0", "max": "1000"}, "4.2"),
+    ("float", "decimal=,", legacy_float, {"decimal": ","}, "4,2"),
+    ("number", "min=0|max=1000", legacy_number, {"min": "0", "max": "1000"}, "42"),
+]
+
+
+def bench(number=200000):
+    print("%-8s %-16s %-8s %12s %12s %8s" % (
+        "type", "spec", "value", "legacy ns", "current ns", "speedup"))
+
+    for name, spec, legacy, kwargs, value in CASES:
+        old = partial(legacy, **kwargs)
+        new = get_validator(name, spec)
+        assert old(value) == new(value)
+
+        t_old = min(timeit.repeat(lambda: old(value), number=number, repeat=5))
+        t_new = min(timeit.repeat(lambda: new(value), number=number, repeat=5))
+
+        print("%-8s %-16s %-8r %12.1f %12.1f %7.2fx" % (
+            name, spec, value,
+            t_old / number * 1e9, t_new / number * 1e9, t_old / t_new))
+
+
+if __name__ == "__main__":
+    bench()
@@ -0,0 +1,122 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from ama_tk import batch
+from ama_tk.batch import validate_many
+from ama_tk.validator import get_validator
+
+
+def scalar(validator, spec, values):
+    func = get_validator(validator, spec)
+    results = []
+    for value in values:
+        try:
+            results.append((func(value), False, None))
+        except (TypeError, ValueError) as exc:
+            results.append((None, True, str(exc)))
+
+    return results
+
+
+def assert_matches_scalar(validator, spec, values):
+    result = validate_many(validator, spec, values)
+    expected = scalar(validator, spec, values.tolist())
+
+    assert result.mask.tolist() == [mask for _v, mask, _m in expected]
+    assert result.messages.tolist() == [msg for _v, _mask, msg in expected]
+    for value, (expected_value, mask, _msg) in zip(result.values.tolist(),
+                                                    expected):
+        if not mask:
+            assert value == expected_value or (
+                value != value and expected_value != expected_value)
+            assert type(value) is type(expected_value)
+
+    return result
+
+
+@pytest.mark.parametrize('validator, spec, values', [
+    ('int', None, np.array(['1', '-2', 'x', '3.5', '', ' 4', '+5'])),
+    ('int', 'min=0|max=10', np.array([-1, 0, 5, 10, 11])),
+    ('int', None, np.array([1.0, 2.5])),
+    ('int', 'decimal=,', np.array(['1', '2,0', 'x'])),
+    ('int', None, np.array([1, 'a', None, 2.5], dtype=object)),
+    ('float', None, np.array(['1', '1.5', 'abc', '-2e3', 'nan'])),
+    ('float', 'min=0|max=1', np.array([-0.5, 0.0, 0.5, 1.0, 1.5])),
+    ('float', None, np.array([1, 2, 3])),
+    ('float', 'decimal=,', np.array(['1,5', '2', 'x,y'])),
+    ('number', None, np.array(['1', '1.5', 'abc'])),
+    ('bool', None, np.array(['Yes', 'n', 'TRUE', '0', 'maybe'])),
+    ('bool', None, np.array([0, 1, 2])),
+    ('bool', None, np.array([True, False])),
+    ('yesno', None, np.array(['y', 'no', 'x'])),
+    ('str', 'min=2', np.array(['a', 'ab', 'abc'])),
+])
+def test_arrays_match_scalar_validation(validator, spec, values):
+    assert_matches_scalar(validator, spec, values)
+
+
+def test_block_splitting(monkeypatch):
+    values = np.array([str(i) for i in range(100)])
+    values[37] = 'x'
+    values[80] = '1.5'
+
+    result = assert_matches_scalar('int', None, values)
+    assert np.flatnonzero(result.mask).tolist() == [37, 80]
+
+    out = np.zeros(len(values), dtype=np.int64)
+    ok = np.zeros(len(values), dtype=bool)
+    batch._convert(np, values, np.int64, out, ok, np.arange(len(values)))
+
+    # Only the small blocks containing the bad values are left unconverted
+    failed = np.flatnonzero(~ok)
+    assert 37 in failed and 80 in failed
+    assert len(failed) <= 2 * batch._SPLIT_LIMIT
+    assert out[ok].tolist() == [int(v) for v in values[ok].tolist()]
+
+    monkeypatch.setattr(batch, '_SPLIT_LIMIT', 1)
+    ok[:] = False
+    batch._convert(np, values, np.int64, out, ok, np.arange(len(values)))
+    assert np.flatnonzero(~ok).tolist() == [37, 80]
+
+
+def test_overflow_falls_back_to_object_array():
+    values = np.array(['1', '99999999999999999999', 'x'])
+    result = assert_matches_scalar('int', None, values)
+
+    assert result.values.dtype == object
+    assert result.values[1] == 99999999999999999999
+
+
+def test_uint64_falls_back_to_scalar_validation():
+    values = np.array([1, 2 ** 63, 2 ** 64 - 1], dtype=np.uint64)
+    result = assert_matches_scalar('int', 'max=9223372036854775808', values)
+
+    assert result.values.dtype == object
+    assert result.mask.tolist() == [False, False, True]
+
+
+def test_nocoerce_on_string_arrays():
+    values = np.array(['1', '1.5', '2', '-0.5', 'a.b'])
+    result = assert_matches_scalar('float', 'nocoerce=1', values)
+    assert result.mask.tolist() == [True, False, True, False, True]
+
+    values = np.array(['1', '1,5'])
+    result = assert_matches_scalar('float', 'nocoerce=1|decimal=,', values)
+    assert result.mask.tolist() == [True, False]
+
+
+def test_nocoerce_rejects_int_arrays():
+    assert_matches_scalar('float', 'nocoerce=1', np.array([1, 2]))
+
+
+def test_two_dimensional_arrays_are_rejected():
+    with pytest.raises(ValueError):
+        validate_many('int', None, np.zeros((2, 2)))
+
+
+def test_lists_are_validated_as_scalars():
+    result = validate_many('int', None, ['1', 'x'])
+    assert result.values == [1, None]
+    assert result.mask == [False, True]
+    assert result.messages == [None, scalar('int', None, ['x'])[0][2]]
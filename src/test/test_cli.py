@@ -0,0 +1,139 @@
+import io
+import json
+
+import pytest
+
+pytest.importorskip('click')
+
+from ama_tk.cli import (
+    load_questions,
+    main,
+    read_directory,
+    read_lines,
+    validate_documents,
+)
+
+QUESTIONS = [
+    {'name': 'port', 'type': 'int', 'format': 'min=1|max=65535'},
+    {'name': 'host', 'type': 'str', 'format': 'nonempty'},
+    {'name': 'mode', 'type': ['fast', 'slow']},
+]
+
+DOCUMENTS = [
+    {'port': '80', 'host': 'example.com', 'mode': 'fast'},
+    {'port': '0', 'host': 'example.com'},
+    {'port': 'x', 'host': '', 'mode': 'medium'},
+    {'host': 'example.com'},
+]
+
+KEYS = {'source', 'valid', 'errors', 'error'}
+
+
+def json_items(documents):
+    lines = '\n'.join(json.dumps(d) for d in documents) + '\n'
+    return list(read_lines(io.StringIO(lines), 'answers.jsonl'))
+
+
+def test_read_lines_skips_blank_lines():
+    fp = io.StringIO('{"a": 1}\n\n   \n{"a": 2}\n')
+    assert list(read_lines(fp, 'answers.jsonl')) == [
+        ('answers.jsonl:1', 'json', '{"a": 1}\n'),
+        ('answers.jsonl:4', 'json', '{"a": 2}\n'),
+    ]
+
+
+def test_read_directory(tmp_path):
+    for name in ('b.json', 'a.json', 'notes.txt'):
+        (tmp_path / name).write_text('{}')
+    (tmp_path / 'dir.json').mkdir()
+
+    directory = str(tmp_path)
+    assert list(read_directory(directory)) == [
+        (str(tmp_path / 'a.json'), 'file', str(tmp_path / 'a.json')),
+        (str(tmp_path / 'b.json'), 'file', str(tmp_path / 'b.json')),
+    ]
+
+
+def test_load_questions(tmp_path):
+    filename = tmp_path / 'questions.json'
+
+    filename.write_text(json.dumps(QUESTIONS))
+    assert load_questions(str(filename)) == QUESTIONS
+
+    filename.write_text(json.dumps({'title': 'T', 'questions': QUESTIONS}))
+    assert load_questions(str(filename)) == QUESTIONS
+
+    filename.write_text(json.dumps({'title': 'T'}))
+    with pytest.raises(ValueError):
+        load_questions(str(filename))
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_validate_documents(jobs):
+    results = list(validate_documents(QUESTIONS, json_items(DOCUMENTS), jobs=jobs,
+                                      chunksize=1))
+
+    assert [valid for valid, _result in results] == [True, False, False, True]
+    for _valid, result in results:
+        assert set(result) == KEYS
+        assert result['error'] is None
+
+    assert [result['source'] for _valid, result in results] == [
+        'answers.jsonl:%d' % n for n in range(1, 5)]
+    assert set(results[1][1]['errors']) == {'port'}
+    assert set(results[2][1]['errors']) == {'port', 'host', 'mode'}
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_validate_documents_require_all(jobs):
+    results = list(validate_documents(QUESTIONS, json_items(DOCUMENTS), jobs=jobs,
+                                      require_all=True))
+
+    assert [valid for valid, _result in results] == [True, False, False, False]
+    assert set(results[3][1]['errors']) == {'port', 'mode'}
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_unreadable_documents(tmp_path, jobs):
+    (tmp_path / 'a.json').write_text('{"port": "80"}')
+    (tmp_path / 'b.json').write_text('{"port": ')
+    (tmp_path / 'c.json').write_text('[1, 2]')
+
+    results = list(validate_documents(QUESTIONS, read_directory(str(tmp_path)),
+                                      jobs=jobs))
+
+    assert [valid for valid, _result in results] == [True, False, False]
+    for _valid, result in results:
+        assert set(result) == KEYS
+
+    assert results[1][1]['errors'] == {}
+    assert results[1][1]['error']
+    assert results[2][1]['error'] == 'Answers must be a JSON object'
+
+
+def test_validate_documents_keeps_order_across_chunks():
+    documents = [{'port': str(n)} for n in range(200)]
+    results = list(validate_documents(QUESTIONS, json_items(documents), jobs=2,
+                                      chunksize=7))
+
+    assert [valid for valid, _result in results] == [n > 0 for n in range(200)]
+
+
+def test_main(tmp_path):
+    from click.testing import CliRunner
+
+    questions = tmp_path / 'questions.json'
+    questions.write_text(json.dumps(QUESTIONS))
+    answers = tmp_path / 'answers.jsonl'
+    answers.write_text('\n'.join(json.dumps(d) for d in DOCUMENTS[:2]))
+
+    runner = CliRunner()
+    result = runner.invoke(main, [str(questions), str(answers), '-j', '1'])
+
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line['valid'] for line in lines] == [True, False]
+
+    answers.write_text(json.dumps(DOCUMENTS[0]))
+    result = runner.invoke(main, [str(questions), str(answers), '-j', '1'])
+    assert result.exit_code == 0
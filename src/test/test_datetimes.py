@@ -0,0 +1,106 @@
+from datetime import date, datetime, time
+
+import pytest
+
+from ama_tk.datetimes import ISO_DATE_FORMAT, ISO_TIME_FORMAT, compile_format
+from ama_tk.validator import Date, Time
+
+CASES = [
+    ('%Y-%m-%d', [
+        '2023-02-09', '2023-2-9', '2023-02-30', '2023-13-01', '2023-00-10',
+        '2023-02-09 ', ' 2023-02-09', '2023-02-09x', '23-02-09', '2023/02/09',
+        '2023-W06-4', '2023-02-0a', '', '2023--02-09', '2023-02- 9',
+    ]),
+    ('%d/%m/%Y', ['9/2/2023', '09/02/2023', ' 9/2/2023', '31/4/2023', '9/2/23']),
+    ('%d/%m/%y', ['9/2/68', '9/2/69', '9/2/00', '9/2/99', '9/2/2023', '9/2/1']),
+    ('%y%m%d', ['230209', '2329', '2302099']),
+    ('%Y%m%d', ['20230209', '202329', '2023129']),
+    ('%H:%M', [
+        '09:30', '9:30', '9:5', '23:59', '24:00', '12:60', '1230', '09:30:00',
+        ' 9:30', '0:00',
+    ]),
+    ('%H:%M:%S', ['09:30:00', '09:30:60', '09:30:61', '09:30:62', '9:3:1']),
+    ('%H:%M:%S.%f', [
+        '09:30:00.5', '09:30:00.123456', '09:30:00.1234567', '09:30:00.',
+        '09:30:00',
+    ]),
+    ('%Y-%m-%d %H:%M', [
+        '2023-02-09 09:30', '2023-02-09  09:30', '2023-02-09\t09:30',
+        '2023-02-0909:30', '2023-02-09 \n 9:30',
+    ]),
+    ('%Y-%m-%dT%H:%M', ['2023-02-09T09:30', '2023-02-09t09:30']),
+    ('(%Y) %m.%d', ['(2023) 02.09', '(2023) 02x09', '2023 02.09']),
+    ('%d %% %m %Y', ['9 % 2 2023', '9 %2 2023']),
+    # Formats which fall back to strptime
+    ('%d %b %Y', ['9 Feb 2023', '9 feb 2023', '9 February 2023']),
+    ('%A %d %B %Y', ['Thursday 09 February 2023', 'Thu 09 Feb 2023']),
+    ('%I:%M %p', ['9:30 PM', '09:30 am', '13:30 PM']),
+    ('%j/%Y', ['40/2023', '366/2023']),
+]
+
+
+def parse(parser, value):
+    try:
+        return parser(value)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize('spec, value', [
+    (spec, value) for spec, values in CASES for value in values
+])
+def test_matches_strptime(spec, value):
+    expected = parse(lambda v: datetime.strptime(v, spec), value)
+    assert parse(compile_format(spec).datetime, value) == expected
+
+
+@pytest.mark.parametrize('value', CASES[0][1] + [
+    '2023-W06', '20230209', '2023-02-09T09:30', '٢023-02-09',
+    '2023-٠٢-09',
+])
+def test_iso_date_fast_path(value):
+    expected = parse(lambda v: datetime.strptime(v, ISO_DATE_FORMAT).date(), value)
+    assert parse(compile_format(ISO_DATE_FORMAT).date, value) == expected
+
+
+@pytest.mark.parametrize('value', CASES[5][1] + [
+    '09:3٠', '09.30', 'T09:30', '09:30Z',
+])
+def test_iso_time_fast_path(value):
+    expected = parse(lambda v: datetime.strptime(v, ISO_TIME_FORMAT).time(), value)
+    assert parse(compile_format(ISO_TIME_FORMAT).time, value) == expected
+
+
+def test_formats_are_shared():
+    assert compile_format('%d/%m/%Y') is compile_format('%d/%m/%Y')
+
+
+@pytest.mark.parametrize('spec, hint', [
+    ('%Y-%m-%d', 'YYYY-MM-DD'),
+    ('%d/%m/%y', 'DD/MM/YY'),
+    ('%H:%M:%S', 'hh:mm:ss'),
+    ('%d %b %Y', 'DD %b YYYY'),
+])
+def test_hint(spec, hint):
+    assert compile_format(spec).hint == hint
+
+
+def test_date_validator():
+    validate = Date('%d/%m/%Y')
+    assert validate('9/2/2023') == date(2023, 2, 9)
+    assert validate(datetime(2023, 2, 9, 10)) == date(2023, 2, 9)
+    assert validate('') == ''
+
+    with pytest.raises(ValueError) as exc:
+        validate('2023-02-09')
+    assert str(exc.value) == 'Invalid date for format DD/MM/YYYY'
+
+
+def test_time_validator():
+    validate = Time()
+    assert validate('09:30') == time(9, 30)
+    assert validate(time(9, 30)) == time(9, 30)
+
+    with pytest.raises(ValueError) as exc:
+        validate('25:00')
+    assert str(exc.value) == 'Invalid time for format hh:mm'
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+
+import pytest
+
+from ama_tk.depends import DependencyIndex, placeholders
+
+
+def index(*items):
+    return DependencyIndex(OrderedDict(items))
+
+
+def test_placeholders():
+    assert placeholders('{name}.py') == {'name'}
+    assert placeholders('{path.parent}/{items[0]}') == {'path', 'items'}
+    assert placeholders('{value:{width}}') == {'value', 'width'}
+    assert placeholders('{0} {}') == frozenset()
+    assert placeholders('{unclosed') == frozenset()
+    assert placeholders(None) == frozenset()
+
+
+def test_unknown_names_are_ignored():
+    idx = index(('a', '{missing}'), ('b', '{a}'))
+    assert idx.dependencies == {'a': frozenset(), 'b': {'a'}}
+    assert idx.dependents == {'a': ['b'], 'b': []}
+
+
+def test_order_keeps_display_order():
+    idx = index(('a', 'x'), ('b', 'y'), ('c', 'z'))
+    assert idx.order == ['a', 'b', 'c']
+
+
+def test_order_puts_dependencies_first():
+    idx = index(('c', '{b}/c'), ('a', 'a'), ('b', '{a}/b'), ('d', 'd'))
+    order = idx.order
+    assert sorted(order) == ['a', 'b', 'c', 'd']
+    assert order.index('a') < order.index('b') < order.index('c')
+
+
+def test_cycle_is_detected():
+    with pytest.raises(ValueError) as exc:
+        index(('a', '{b}'), ('b', '{a}'))
+    assert 'a, b' in str(exc.value)
+
+
+def test_self_reference_is_a_cycle():
+    with pytest.raises(ValueError) as exc:
+        index(('a', '{a}'))
+    assert 'a' in str(exc.value)
+
+
+def test_cycle_error_lists_only_the_cycle():
+    with pytest.raises(ValueError) as exc:
+        index(('root', 'r'), ('a', '{root}{c}'), ('b', '{a}'), ('c', '{b}'),
+              ('d', '{c}'), ('e', '{d}'))
+
+    assert str(exc.value) == 'The defaults for a, b, c depend on each other'
+
+
+def test_affected_closure():
+    idx = index(('a', 'a'), ('b', '{a}'), ('c', '{b}'), ('d', '{a}{c}'),
+                ('e', 'e'))
+    assert idx.affected('a') == ('b', 'c', 'd')
+    assert idx.affected('b') == ('c', 'd')
+    assert idx.affected('d') == ()
+    assert idx.affected('e') == ()
+    assert idx.affected('unknown') == ()
+
+
+def test_affected_follows_update_order():
+    idx = index(('c', '{b}'), ('b', '{a}'), ('a', 'a'))
+    assert idx.affected('a') == ('b', 'c')
+
+
+def test_affected_is_memoized():
+    idx = index(('a', 'a'), ('b', '{a}'))
+    assert idx.affected('a') is idx.affected('a')
@@ -0,0 +1,130 @@
+import types
+
+import pytest
+
+from ama_tk import validator
+from ama_tk.email_address import (
+    BUILTIN_TLDS_FILE,
+    MAX_ADDRESS_LENGTH,
+    MAX_LOCAL_LENGTH,
+    is_email,
+    load_tlds,
+    resolve_tlds,
+)
+
+
+@pytest.mark.parametrize('value', [
+    'a@b.com',
+    'first.last@example.co.uk',
+    "o'neil+tag@sub-domain.example.org",
+    'a@b.xn--p1ai',
+    'a@xn--bcher-kva.example',
+])
+def test_valid_addresses(value):
+    assert is_email(value)
+
+
+@pytest.mark.parametrize('value', [
+    'a..b@example.com',
+    '.a@example.com',
+    'a.@example.com',
+    'a@example..com',
+    'a@.example.com',
+    'a@example.com.',
+    'a@example',
+    'a@-example.com',
+    'a@example.c',
+    'a@example.xn--',
+    'a b@example.com',
+    '@example.com',
+    'a@',
+])
+def test_invalid_addresses(value):
+    assert not is_email(value)
+
+
+def test_local_part_length():
+    domain = '@example.com'
+    assert is_email('a' * MAX_LOCAL_LENGTH + domain)
+    assert not is_email('a' * (MAX_LOCAL_LENGTH + 1) + domain)
+
+
+def test_address_length():
+    local = 'a' * MAX_LOCAL_LENGTH
+
+    def address(last_label):
+        return '%s@%s.%s.%s.com' % (local, 'b' * 63, 'b' * 63, 'b' * last_label)
+
+    assert len(address(57)) == MAX_ADDRESS_LENGTH
+    assert is_email(address(57))
+    assert not is_email(address(58))
+
+
+def test_builtin_tlds():
+    tlds = resolve_tlds('builtin')
+    assert tlds is load_tlds(BUILTIN_TLDS_FILE)
+
+    for tld in ('com', 'uk', 'club', 'live', 'agency', 'law', 'xn--p1ai'):
+        assert tld in tlds
+        assert is_email('a@b.' + tld, tlds)
+
+    assert 'zz' not in tlds
+    assert not is_email('a@b.zz', tlds)
+    assert is_email('a@b.COM', tlds)
+
+
+def test_tlds_file(tmp_path):
+    filename = tmp_path / 'tlds.txt'
+    filename.write_text('# Version 1\nCOM\n\nexample\n')
+
+    tlds = resolve_tlds(str(filename))
+    assert tlds == {'com', 'example'}
+    assert is_email('a@b.example', tlds)
+    assert not is_email('a@b.org', tlds)
+
+
+def test_no_tlds():
+    assert resolve_tlds(None) is None
+    assert resolve_tlds('') is None
+    assert is_email('a@b.zz', None)
+
+
+def test_email_validator_without_pyisemail():
+    validate = validator.Email('re', tlds='builtin')
+    assert validate('a@b.club') == 'a@b.club'
+
+    with pytest.raises(ValueError):
+        validate('a@b.zz')
+
+    with pytest.raises(ValueError):
+        validate('a..b@example.com')
+
+
+def test_email_validator_filters_tlds_after_pyisemail(monkeypatch):
+    checked = []
+
+    def fake_is_email(value, **options):
+        checked.append((value, options))
+        return True
+
+    fake = types.SimpleNamespace(is_email=fake_is_email)
+    monkeypatch.setattr(validator, '_pyisemail', lambda: fake)
+
+    validate = validator.Email(tlds='builtin', check_dns='no')
+    assert validate('a@b.club') == 'a@b.club'
+
+    with pytest.raises(ValueError):
+        validate('a@b.zz')
+
+    assert checked == [('a@b.club', {'check_dns': False}),
+                       ('a@b.zz', {'check_dns': False})]
+
+
+def test_email_validator_with_pyisemail():
+    pytest.importorskip('pyisemail')
+
+    validate = validator.Email(tlds='builtin')
+    assert validate('a@b.club') == 'a@b.club'
+
+    with pytest.raises(ValueError):
+        validate('a@b.zz')
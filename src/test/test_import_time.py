@@ -0,0 +1,76 @@
+# Copyright 2013-2014, Simon Kennedy, sffjunkie+code@gmail.com
+
+"""Check the import time of the ama_tk modules against a budget.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``.
+The test fails if the median cumulative import time is over budget or if any
+of the modules which should only be imported on first use were imported.
+"""
+
+import os.path
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+RUNS = 5
+
+VALIDATOR_BUDGET = 50
+VALIDATOR_LAZY = [
+    "pkg_resources", "importlib.metadata", "pyisemail", "gettext", "csv",
+    "tempfile", "shutil", "numpy",
+]
+
+PLUGIN_BUDGET = 50
+PLUGIN_LAZY = ["tkinter", "click", "tks", "ama_tk.asker", "ama_tk.validator"]
+
+
+def import_times(module):
+    """Import `module` in a new interpreter and return a dictionary of the
+    cumulative import time in microseconds for every module imported.
+    """
+
+    env = dict(os.environ, PYTHONPATH=SRC)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def check_budget(module, budget, lazy):
+    runs = [import_times(module) for _ in range(RUNS)]
+    median = statistics.median(r[module] for r in runs) / 1000
+
+    imported = sorted(
+        name for name in runs[0]
+        if any(name == m or name.startswith(m + ".") for m in lazy)
+    )
+
+    assert not imported, "%s imported %s" % (module, ", ".join(imported))
+    assert median <= budget, "%s took %.1f ms to import (budget %d ms)" % (
+        module, median, budget)
+
+
+def test_validator_import_time():
+    check_budget("ama_tk.validator", VALIDATOR_BUDGET, VALIDATOR_LAZY)
+
+
+def test_plugin_import_time():
+    pytest.importorskip("ama")
+    check_budget("ama_tk.plugin", PLUGIN_BUDGET, PLUGIN_LAZY)
@@ -0,0 +1,154 @@
+import os
+
+import pytest
+
+from ama_tk import paths
+from ama_tk.paths import MISSING, PathCache, PathInfo, path_info, stat_path
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(paths, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    real_stat_path = paths.stat_path
+
+    def recording(path, need_empty=False):
+        calls.append((os.path.basename(path), need_empty))
+        return real_stat_path(path, need_empty)
+
+    monkeypatch.setattr(paths, 'stat_path', recording)
+    return calls
+
+
+def test_stat_path(tmp_path):
+    (tmp_path / 'file').write_text('')
+    (tmp_path / 'empty').mkdir()
+
+    assert stat_path(str(tmp_path / 'missing')) is MISSING
+    assert stat_path(str(tmp_path / 'file')) == PathInfo(True, False, None)
+    assert stat_path(str(tmp_path)) == PathInfo(True, True, None)
+    assert stat_path(str(tmp_path), need_empty=True) == PathInfo(True, True, False)
+    assert stat_path(str(tmp_path / 'empty'), True) == PathInfo(True, True, True)
+
+
+def test_entries_are_cached(tmp_path, clock, reads):
+    cache = PathCache(ttl=2)
+    path = str(tmp_path)
+
+    assert cache.info(path).is_dir
+    assert cache.info(path).is_dir
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(reads) == 1
+
+
+def test_entries_expire(tmp_path, clock, reads):
+    cache = PathCache(ttl=2)
+    path = str(tmp_path / 'new')
+
+    assert not cache.info(path).exists
+    os.mkdir(path)
+
+    clock[0] += 1.9
+    assert not cache.info(path).exists
+
+    clock[0] += 0.2
+    assert cache.info(path).exists
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_least_recently_used_entry_is_dropped(tmp_path, clock, reads):
+    cache = PathCache(maxsize=2)
+    a, b, c = (str(tmp_path / name) for name in 'abc')
+
+    cache.info(a)
+    cache.info(b)
+    cache.info(a)
+    cache.info(c)
+    assert reads == [('a', False), ('b', False), ('c', False)]
+
+    cache.info(a)
+    cache.info(b)
+    assert reads[-1] == ('b', False)
+    assert cache.misses == 4
+
+
+def test_emptiness_is_read_when_first_needed(tmp_path, clock, reads):
+    cache = PathCache()
+    path = str(tmp_path)
+
+    assert cache.info(path) == PathInfo(True, True, None)
+    assert cache.info(path, need_empty=True) == PathInfo(True, True, True)
+    assert cache.info(path, need_empty=True).empty is True
+    assert cache.info(path).empty is True
+
+    name = tmp_path.name
+    assert reads == [(name, False), (name, True)]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_files_are_not_read_again_for_emptiness(tmp_path, clock, reads):
+    (tmp_path / 'file').write_text('')
+    cache = PathCache()
+    path = str(tmp_path / 'file')
+
+    cache.info(path)
+    assert cache.info(path, need_empty=True) == PathInfo(True, False, None)
+    assert len(reads) == 1
+
+
+def test_invalidate(tmp_path, clock, reads):
+    cache = PathCache()
+    path = str(tmp_path / 'new')
+
+    assert not cache.info(path).exists
+    os.mkdir(path)
+    cache.invalidate(path)
+    assert cache.info(path).exists
+    assert cache.misses == 2
+
+
+def test_clear(tmp_path, clock, reads):
+    cache = PathCache()
+    for name in 'ab':
+        cache.info(str(tmp_path / name))
+
+    cache.clear()
+    cache.info(str(tmp_path / 'a'))
+    assert cache.misses == 3
+
+
+def test_path_info_uses_the_enabled_cache(tmp_path, reads):
+    path = str(tmp_path)
+    try:
+        cache = paths.enable_path_cache()
+        path_info(path)
+        path_info(path)
+        assert (cache.hits, cache.misses) == (1, 1)
+    finally:
+        paths.disable_path_cache()
+
+    assert paths.path_cache is None
+    path_info(path)
+    assert len(reads) == 2
+
+
+def test_inotify_invalidates_entries(tmp_path):
+    pytest.importorskip('inotify_simple')
+
+    cache = PathCache(ttl=60, inotify=True)
+    if not cache.uses_inotify:
+        pytest.skip('inotify is not available')
+
+    try:
+        path = str(tmp_path / 'new')
+        assert not cache.info(path).exists
+        os.mkdir(path)
+        assert cache.info(path).exists
+    finally:
+        cache.close()
@@ -0,0 +1,150 @@
+import os
+
+import pytest
+
+from ama_tk import paths
+from ama_tk.paths import (
+    DEFAULT_NAME_MAX,
+    WINDOWS_NAME_MAX,
+    WINDOWS_PATH_MAX,
+    directory_limits,
+    is_creatable,
+    is_valid_path_name,
+)
+from ama_tk.validator import Path
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        is_valid_path_name('a', 'dos')
+
+
+@pytest.mark.parametrize('profile', ['posix', 'windows'])
+def test_nul_byte(profile):
+    assert not is_valid_path_name('a\0b', profile)
+
+
+def test_posix_component_length(tmp_path):
+    _ancestor, name_max, _path_max = directory_limits(str(tmp_path))
+
+    assert is_valid_path_name(str(tmp_path / ('a' * name_max)), 'posix')
+    assert not is_valid_path_name(str(tmp_path / ('a' * (name_max + 1))), 'posix')
+
+
+def test_posix_component_length_is_in_bytes(tmp_path):
+    _ancestor, name_max, _path_max = directory_limits(str(tmp_path))
+    name = '\u00e9' * (name_max // 2 + 1)
+
+    assert not is_valid_path_name(str(tmp_path / name), 'posix')
+
+
+def test_posix_total_length(tmp_path):
+    _ancestor, name_max, path_max = directory_limits(str(tmp_path))
+    component = 'a' * min(name_max, DEFAULT_NAME_MAX)
+
+    path = str(tmp_path)
+    while len(os.fsencode(path)) + len(component) + 1 < path_max:
+        path = os.path.join(path, component)
+
+    path = path[:path_max - 1]
+    assert is_valid_path_name(path, 'posix')
+    assert not is_valid_path_name(path + 'a', 'posix')
+
+
+def test_posix_allows_windows_names(tmp_path):
+    for name in ('CON', 'a:b', 'trailing.', 'a?'):
+        assert is_valid_path_name(str(tmp_path / name), 'posix')
+
+
+@pytest.mark.parametrize('name', [
+    'CON', 'con', 'PRN', 'AUX', 'NUL', 'COM1', 'LPT9', 'con.txt', 'NUL .txt',
+])
+def test_windows_reserved_names(name):
+    assert not is_valid_path_name('C:\\dir\\' + name, 'windows')
+
+
+@pytest.mark.parametrize('name', ['CONSOLE', 'COM0', 'LPT10', 'xcon'])
+def test_windows_names_like_reserved_names(name):
+    assert is_valid_path_name('C:\\dir\\' + name, 'windows')
+
+
+@pytest.mark.parametrize('name', ['name.', 'name ', 'dir.\\name'])
+def test_windows_trailing_dot_or_space(name):
+    assert not is_valid_path_name('C:\\' + name, 'windows')
+
+
+@pytest.mark.parametrize('char', list('<>:"|?*') + ['\x1f'])
+def test_windows_invalid_characters(char):
+    assert not is_valid_path_name('C:\\dir\\a%sb' % char, 'windows')
+
+
+def test_windows_lengths():
+    assert is_valid_path_name('C:\\' + 'a' * WINDOWS_NAME_MAX, 'windows')
+    assert not is_valid_path_name('C:\\' + 'a' * (WINDOWS_NAME_MAX + 1), 'windows')
+
+    path = 'C:\\' + '\\'.join(['a' * 50] * 6)
+    assert len(path) >= WINDOWS_PATH_MAX
+    assert not is_valid_path_name(path, 'windows')
+    assert is_valid_path_name('\\\\?\\' + path, 'windows')
+
+
+def test_windows_relative_components():
+    assert is_valid_path_name('C:\\dir\\..\\.\\name', 'windows')
+    assert is_valid_path_name('dir/name', 'windows')
+
+
+def test_nearest_existing_ancestor(tmp_path):
+    path = str(tmp_path / 'a' / 'b')
+    assert directory_limits(path)[0] == str(tmp_path)
+
+    os.makedirs(path)
+    assert directory_limits(path)[0] == path
+
+    os.rmdir(path)
+    assert directory_limits(path)[0] == str(tmp_path / 'a')
+
+
+def test_limits_are_read_once_per_device(tmp_path, monkeypatch):
+    calls = []
+
+    def pathconf(path, name, default):
+        calls.append(name)
+        return default
+
+    monkeypatch.setattr(paths, '_device_limits', {})
+    monkeypatch.setattr(paths, '_pathconf', pathconf)
+
+    directory_limits(str(tmp_path))
+    directory_limits(str(tmp_path / 'missing'))
+    assert calls == ['PC_NAME_MAX', 'PC_PATH_MAX']
+
+
+def test_is_creatable(tmp_path):
+    assert is_creatable(str(tmp_path / 'a' / 'b'))
+
+
+def test_new_path_validator(tmp_path):
+    validate = Path('new', profile='windows')
+    assert validate(str(tmp_path / 'name')) == str(tmp_path / 'name')
+    assert validate('') == ''
+
+    with pytest.raises(ValueError):
+        validate(str(tmp_path / 'CON'))
+
+    with pytest.raises(ValueError):
+        validate(str(tmp_path))
+
+
+def test_new_path_validator_checks_access(tmp_path, monkeypatch):
+    monkeypatch.setattr('ama_tk.validator.is_creatable', lambda path: False)
+    path = str(tmp_path / 'name')
+
+    assert Path('new', access='false')(path) == path
+
+    with pytest.raises(ValueError):
+        Path('new', access='yes')(path)
+
+
+def test_new_path_validator_rejects_unknown_profile():
+    with pytest.raises(ValueError):
+        Path('new', profile='dos')
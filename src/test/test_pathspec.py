@@ -0,0 +1,141 @@
+import glob
+import os
+
+import pytest
+
+from ama_tk import paths
+from ama_tk.paths import Pathspec
+from ama_tk.validator import Path
+
+NAMES = [
+    'a.txt', 'b.txt', 'c.py', 'README', '.hidden', '.config.txt', 'data.csv',
+]
+
+PATTERNS = [
+    '*.txt', '*.py', '*.md', '*', '.*', '.h*', '*hidden', '?.txt', '[ab].txt',
+    'README', 'readme', 'sub/*.txt', 'sub/*.py', '*/x.txt', 'missing/*',
+]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for name in NAMES:
+        (tmp_path / name).write_text('')
+
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'x.txt').write_text('')
+    return str(tmp_path)
+
+
+def globbed(directory, pattern):
+    return bool(glob.glob(os.path.join(directory, pattern)))
+
+
+@pytest.mark.parametrize('pattern', PATTERNS)
+def test_include_matches_glob(tree, pattern):
+    match = Pathspec([pattern], []).scan(tree)
+    assert (pattern in match.included) == globbed(tree, pattern)
+
+
+@pytest.mark.parametrize('pattern', PATTERNS)
+def test_exclude_matches_glob(tree, pattern):
+    match = Pathspec([], [pattern]).scan(tree)
+    assert (pattern in match.excluded) == globbed(tree, pattern)
+
+
+def test_all_patterns_together(tree):
+    match = Pathspec(PATTERNS, PATTERNS).scan(tree)
+    expected = tuple(p for p in PATTERNS if globbed(tree, p))
+    assert match.included == expected
+    assert match.excluded == expected
+
+
+def test_hidden_names_need_a_dotted_pattern(tmp_path):
+    (tmp_path / '.only').write_text('')
+    directory = str(tmp_path)
+
+    assert Pathspec(['*'], []).scan(directory).included == ()
+    assert Pathspec(['.*'], []).scan(directory).included == ('.*',)
+    assert not globbed(directory, '*')
+    assert globbed(directory, '.*')
+
+
+def test_separator_patterns_use_glob(tree, monkeypatch):
+    calls = []
+    real_glob = glob.glob
+
+    def recording_glob(pattern, *args, **kwargs):
+        calls.append(pattern)
+        return real_glob(pattern, *args, **kwargs)
+
+    monkeypatch.setattr(paths.glob, 'glob', recording_glob)
+
+    match = Pathspec(['*.txt', 'sub/*.txt'], []).scan(tree)
+    assert match.included == ('*.txt', 'sub/*.txt')
+    assert calls == [os.path.join(tree, 'sub/*.txt')]
+
+
+def counting_scandir(monkeypatch):
+    seen = []
+    real_scandir = os.scandir
+
+    class Counting(object):
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self._it.close()
+
+        def __iter__(self):
+            for entry in self._it:
+                seen.append(entry.name)
+                yield entry
+
+    monkeypatch.setattr(paths.os, 'scandir', Counting)
+    return seen
+
+
+def test_scan_stops_when_every_include_has_matched(tmp_path, monkeypatch):
+    for idx in range(100):
+        (tmp_path / ('f%03d.txt' % idx)).write_text('')
+
+    seen = counting_scandir(monkeypatch)
+    match = Pathspec(['*.txt'], []).scan(str(tmp_path))
+
+    assert match.included == ('*.txt',)
+    assert len(seen) == 1
+
+
+def test_scan_continues_until_an_exclude_is_seen(tmp_path, monkeypatch):
+    for idx in range(100):
+        (tmp_path / ('f%03d.txt' % idx)).write_text('')
+
+    seen = counting_scandir(monkeypatch)
+    match = Pathspec(['*.txt'], ['*.py']).scan(str(tmp_path))
+
+    assert match == (('*.txt',), ())
+    assert len(seen) == 100
+
+
+def test_missing_directory(tmp_path):
+    missing = str(tmp_path / 'missing')
+    assert Pathspec(['*'], ['*']).scan(missing) == ((), ())
+
+
+def test_validator_accepts_matching_directory(tree):
+    validate = Path('+*.txt', '+sub/*.txt', '-*.md')
+    assert validate(tree) == tree
+
+
+def test_validator_lists_failed_patterns(tree):
+    validate = Path('+*.md', '+*.rst', '+*.txt', '-*.py', '-*.csv', '-*.exe')
+
+    with pytest.raises(ValueError) as exc:
+        validate(tree)
+
+    assert str(exc.value) == (
+        'Path %s should contain files matching *.md,*.rst and should not '
+        'contain files matching *.py,*.csv' % tree)
@@ -0,0 +1,137 @@
+import pytest
+
+from ama_tk.validator import (
+    Pipeline,
+    get_validator,
+    is_pipeline,
+    pipeline_stages,
+    validator_cost,
+    validators,
+)
+
+
+def recorder(calls, name, result=None, fail=False):
+    def factory(*args, **kwargs):
+        def validate(value):
+            calls.append((name, value))
+            if fail:
+                raise ValueError('%s failed' % name)
+            return value if result is None else result(value)
+
+        return validate
+
+    return factory
+
+
+def test_is_pipeline():
+    assert is_pipeline('str & re')
+    assert not is_pipeline('str')
+    assert not is_pipeline(['a', 'b'])
+
+
+def test_stages():
+    assert pipeline_stages('str & re & nonempty', [None, '^a', None]) == [
+        ('str', None), ('re', '^a'), ('nonempty', None)]
+    assert pipeline_stages('int&re', 'min=1') == [('int', 'min=1'), ('re', None)]
+
+
+def test_spec_count_mismatch():
+    with pytest.raises(ValueError):
+        pipeline_stages('str & re', [None])
+
+    with pytest.raises(ValueError):
+        get_validator('str & re', [None, '^a', None])
+
+
+@pytest.mark.parametrize('validator', ['str & ', '& str', 'str && re'])
+def test_empty_stage(validator):
+    with pytest.raises(ValueError):
+        get_validator(validator)
+
+
+def test_cost_is_sum_of_stages():
+    assert validator_cost('str & re') == validator_cost('str') + validator_cost('re')
+
+
+def test_checks_run_cheapest_first():
+    calls = []
+    with validators.override(
+        str=recorder(calls, 'str', result=str.upper),
+        nonempty=recorder(calls, 'nonempty'),
+        re=recorder(calls, 're'),
+        path=recorder(calls, 'path'),
+    ):
+        validate = get_validator('str & path & re & nonempty')
+        assert validate('abc') == 'ABC'
+
+    assert [name for name, _value in calls] == ['nonempty', 'str', 're', 'path']
+
+
+def test_stops_at_first_failure():
+    calls = []
+    with validators.override(
+        str=recorder(calls, 'str'),
+        nonempty=recorder(calls, 'nonempty', fail=True),
+        re=recorder(calls, 're'),
+    ):
+        validate = get_validator('str & re & nonempty')
+        with pytest.raises(ValueError) as exc:
+            validate('abc')
+
+    assert str(exc.value) == 'nonempty failed'
+    assert calls == [('nonempty', 'abc')]
+
+
+def test_converter_runs_once():
+    calls = []
+    with validators.override(
+        int=recorder(calls, 'int', result=int),
+        re=recorder(calls, 're'),
+        float=recorder(calls, 'float'),
+    ):
+        assert get_validator('int & re & float')('12') == 12
+
+    assert [name for name, _value in calls].count('int') == 1
+
+
+def test_text_checks_get_the_text():
+    validate = get_validator('int & re', [None, '^1'])
+    assert validate(15) == 15
+    assert validate('12') == 12
+
+    with pytest.raises(ValueError):
+        validate(5)
+
+    assert get_validator('int & nonempty')(0) == 0
+
+    with pytest.raises(ValueError):
+        get_validator('int & nonempty')(None)
+
+
+def test_other_checks_get_the_converted_value():
+    calls = []
+    with validators.override(
+        str=recorder(calls, 'str', result=str.strip),
+        int=recorder(calls, 'int'),
+        re=recorder(calls, 're'),
+    ):
+        get_validator('str & int & re')(' 12 ')
+
+    assert calls == [('str', ' 12 '), ('int', '12'), ('re', ' 12 ')]
+
+
+def test_checks_with_specs():
+    validate = get_validator('int & int', [None, 'min=3'])
+    assert validate('4') == 4
+
+    with pytest.raises(ValueError):
+        validate('2')
+
+
+def test_pipelines_are_cached():
+    assert get_validator('str & re', [None, '^a']) is \
+        get_validator('str & re', [None, '^a'])
+
+
+def test_pipeline_without_checks():
+    assert Pipeline((2, int, False))('3') == 3
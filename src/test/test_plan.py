@@ -0,0 +1,144 @@
+import pytest
+
+from ama_tk.plan import PlanResult, ValidationPlan
+from ama_tk.validator import FILESYSTEM_COST, validator_cost
+
+QUESTIONS = [
+    {'name': 'project', 'type': 'str', 'format': 'nonempty'},
+    {'name': 'directory', 'type': 'path', 'format': 'new'},
+    {'name': 'port', 'type': 'int', 'format': 'min=1|max=65535'},
+    {'name': 'workers', 'type': 'int', 'format': 'min=1|max=65535'},
+    {'name': 'retries', 'type': 'int'},
+    {'name': 'mode', 'type': ['fast', 'slow']},
+    {'name': 'started', 'type': 'date'},
+    {'name': 'debug', 'type': 'bool'},
+]
+
+
+@pytest.fixture
+def plan():
+    return ValidationPlan(QUESTIONS)
+
+
+def test_questions_with_the_same_validator_are_grouped(plan):
+    groups = {step.names: (step.validator, step.spec) for step in plan.steps}
+
+    assert groups[('port', 'workers')] == ('int', 'min=1|max=65535')
+    assert groups[('retries',)] == ('int', None)
+    assert len(plan.steps) == len(QUESTIONS) - 1
+    assert plan.names == [q['name'] for q in QUESTIONS]
+
+
+def test_grouped_questions_share_a_validator(plan):
+    step = [s for s in plan.steps if s.names == ('port', 'workers')][0]
+    assert step.validate('80') == 80
+
+
+def test_list_types_are_grouped():
+    plan = ValidationPlan([
+        {'name': 'a', 'type': ['x', 'y']},
+        {'name': 'b', 'type': ['x', 'y']},
+        {'name': 'c', 'type': ['x', 'z']},
+    ])
+
+    assert [step.names for step in plan.steps] == [('a', 'b'), ('c',)]
+
+
+def test_steps_are_ordered_by_cost(plan):
+    costs = [step.cost for step in plan.steps]
+    assert costs == sorted(costs)
+    assert plan.steps[-1].validator == 'path'
+    assert plan.steps[-1].cost == FILESYSTEM_COST
+
+
+def test_equal_costs_keep_question_order(plan):
+    int_steps = [step.names for step in plan.steps if step.validator == 'int']
+    assert int_steps == [('port', 'workers'), ('retries',)]
+
+
+def test_validate(plan, tmp_path):
+    answers = {
+        'project': 'demo',
+        'directory': str(tmp_path / 'new'),
+        'port': '8080',
+        'workers': 4,
+        'retries': '3',
+        'mode': 'fast',
+        'started': '2023-02-09',
+        'debug': 'yes',
+    }
+
+    result = plan.validate(answers)
+    assert isinstance(result, PlanResult)
+    assert result.valid
+    assert result.errors == {}
+    assert result.answers['port'] == 8080
+    assert result.answers['debug'] is True
+    assert str(result.answers['started']) == '2023-02-09'
+
+
+def test_invalid_answers(plan, tmp_path):
+    result = plan.validate({
+        'project': '',
+        'directory': str(tmp_path),
+        'port': '0',
+        'workers': 'many',
+        'mode': 'medium',
+        'debug': True,
+    })
+
+    assert not result.valid
+    assert set(result.errors) == {'project', 'directory', 'port', 'workers', 'mode'}
+    assert result.answers == {'debug': True}
+
+
+def test_missing_answers(plan):
+    assert plan.validate({}).valid
+
+    result = plan.validate({'port': '80'}, require_all=True)
+    assert not result.valid
+    assert 'port' not in result.errors
+    assert set(result.errors) == set(q['name'] for q in QUESTIONS) - {'port'}
+    assert result.errors['mode'] == 'No answer provided'
+
+
+def test_from_question_data():
+    plan = ValidationPlan.from_question_data({'title': 'T', 'questions': QUESTIONS})
+    assert plan.names == [q['name'] for q in QUESTIONS]
+
+
+def test_unknown_validator():
+    with pytest.raises(KeyError):
+        ValidationPlan([{'name': 'a', 'type': 'no-such-validator'}])
+
+
+def test_pipeline_cost():
+    plan = ValidationPlan([{'name': 'a', 'type': 'str & re', 'format': [None, '^a']}])
+    assert plan.steps[0].cost == validator_cost('str & re')
+    assert plan.validate({'a': 'abc'}).valid
+    assert not plan.validate({'a': 'b'}).valid
+
+
+def test_cerberus_schema(plan, tmp_path):
+    cerberus = pytest.importorskip('cerberus')
+
+    schema = plan.to_cerberus()
+    assert set(schema) == set(q['name'] for q in QUESTIONS)
+
+    validator = cerberus.Validator(schema)
+    assert validator.validate({'project': 'demo', 'port': '80', 'mode': 'slow'})
+    assert validator.validate({})
+
+    assert not validator.validate({'port': '0', 'mode': 'medium',
+                                   'directory': str(tmp_path)})
+    assert set(validator.errors) == {'port', 'mode', 'directory'}
+    assert validator.errors['port'] == [plan.validate({'port': '0'}).errors['port']]
+
+
+def test_cerberus_schema_require_all(plan):
+    cerberus = pytest.importorskip('cerberus')
+
+    validator = cerberus.Validator(plan.to_cerberus(require_all=True))
+    assert not validator.validate({'port': '80'})
+    assert 'port' not in validator.errors
+    assert 'mode' in validator.errors
@@ -0,0 +1,102 @@
+from datetime import date
+
+import pytest
+
+from ama_tk.question import QuestionState
+
+
+class Asker(object):
+    def __init__(self):
+        self.calls = []
+
+    def validity_changed(self, key, valid):
+        self.calls.append(('validity_changed', key, valid))
+
+    def answer_changed(self, key, text):
+        self.calls.append(('answer_changed', key, text))
+
+    def flush_changes(self):
+        pass
+
+    def check_invalid(self):
+        pass
+
+
+class Question(QuestionState):
+    def __init__(self, asker, question):
+        super(Question, self).__init__(asker, question)
+        self.text = ''
+        self._set_initial_value()
+
+    def _read(self):
+        return self.text
+
+    def _write(self, value, validated, valid):
+        self.text = value
+        self._value_cached = False
+
+
+def question(**kwargs):
+    kwargs.setdefault('name', 'q')
+    kwargs.setdefault('message', 'Q')
+    return Question(Asker(), kwargs)
+
+
+def test_initial_values():
+    assert question(type=['a', 'b']).value == 'a'
+    assert question(type='bool').value is False
+    assert question(type='yesno', default=True).value is True
+    assert question(type='date', default='2023-02-09').value == date(2023, 2, 9)
+    assert question(type='password', default='secret').text == 'secret'
+    assert question(type='str', default='{a}').text == ''
+
+
+def test_pipeline_type():
+    assert question(type='str & re', format=[None, '^a']).type == 'str'
+
+
+def test_update():
+    q = question(type='str', default='{a}-{b}')
+    q.update({'a': 1, 'b': 2})
+    assert q.value == '1-2'
+
+    q.edit('x')
+    q.update({'a': 3, 'b': 4})
+    assert q.text == '1-2'
+    assert q._asker.calls == [('answer_changed', 'q', 'x')]
+
+
+@pytest.mark.parametrize('type_', ['date', 'password', 'bool'])
+def test_types_which_are_not_updated(type_):
+    q = question(type=type_)
+    q.update({'a': 1})
+    assert q.text in ('', False)
+
+
+def test_check():
+    q = question(type='int')
+
+    assert not q.check('x')
+    assert not q.valid
+    assert q.value == ''
+    assert q._asker.calls == [('validity_changed', 'q', False)]
+
+    assert q.check(' ')
+    assert q.valid
+    assert not q.edited
+
+    q = question(type='str', format='nonempty')
+    assert q.check('')
+    assert not q.valid
+    assert q.edited
+
+
+def test_value_is_cached_until_invalidated():
+    q = question(type='int')
+    q.value = '3'
+    assert q.value == 3
+
+    q.text = '4'
+    assert q.value == 3
+    q._invalidate_value()
+    assert q.value == 4
@@ -0,0 +1,122 @@
+import re
+import sys
+
+import pytest
+
+from ama_tk import validator
+from ama_tk.validator import LRUCache, Regex, compile_regex, regex_cache_info
+
+
+@pytest.fixture
+def regex_cache(monkeypatch):
+    cache = LRUCache(maxsize=2)
+    monkeypatch.setattr(validator, 'regex_cache', cache)
+    return cache
+
+
+def test_compiled_patterns_are_shared(regex_cache):
+    first = compile_regex('^a+$', 'i')
+    assert compile_regex('^a+$', 'i') is first
+    assert compile_regex('^a+$') is not first
+    assert first.flags & re.IGNORECASE
+
+    info = regex_cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_validators_share_compiled_patterns(regex_cache):
+    Regex('^a')
+    Regex('^a', fullmatch=1)
+    assert regex_cache_info().misses == 1
+    assert regex_cache_info().hits == 1
+
+
+def test_least_recently_used_pattern_is_evicted(regex_cache):
+    a = compile_regex('a')
+    compile_regex('b')
+    compile_regex('a')
+    compile_regex('c')
+
+    info = regex_cache_info()
+    assert info.evictions == 1
+    assert compile_regex('a') is a
+    assert regex_cache_info().misses == 3
+
+    compile_regex('b')
+    assert regex_cache_info().misses == 4
+
+
+@pytest.mark.parametrize('flags, expected', [
+    ('i', re.IGNORECASE),
+    ('ms', re.MULTILINE | re.DOTALL),
+    ('ax', re.ASCII | re.VERBOSE),
+])
+def test_flags(flags, expected):
+    assert compile_regex('a', flags).flags & expected == expected
+
+
+def test_unknown_flag():
+    with pytest.raises(ValueError):
+        compile_regex('a', 'q')
+
+
+def test_invalid_flag_combination():
+    # LOCALE can't be used with a str pattern
+    with pytest.raises(ValueError):
+        Regex('a', flags='l')
+
+
+def test_invalid_pattern():
+    with pytest.raises(ValueError):
+        Regex('(')
+
+
+def test_match_at_start():
+    validate = Regex('^a')
+    assert validate('ab') == 'ab'
+
+    with pytest.raises(ValueError):
+        validate('ba')
+
+
+@pytest.mark.parametrize('fullmatch', [1, '1', 'true', 'yes'])
+def test_fullmatch(fullmatch):
+    validate = Regex('a', fullmatch=fullmatch)
+    assert validate('a') == 'a'
+
+    with pytest.raises(ValueError):
+        validate('ab')
+
+
+@pytest.mark.parametrize('fullmatch', [0, '0', 'false', 'no'])
+def test_fullmatch_disabled(fullmatch):
+    assert Regex('a', fullmatch=fullmatch)('ab') == 'ab'
+
+
+def test_flags_option():
+    assert Regex('^A', flags='i')('abc') == 'abc'
+
+
+def test_no_pattern():
+    assert Regex()(12) == '12'
+    assert Regex('')('x') == 'x'
+
+
+def test_timeout_without_regex_module(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'regex', None)
+
+    with pytest.warns(UserWarning):
+        validate = Regex('^a', timeout=1)
+
+    assert validate('a') == 'a'
+
+
+def test_timeout():
+    pytest.importorskip('regex')
+
+    validate = Regex('^(a|aa)+$', timeout=0.05)
+    assert validate('aaa') == 'aaa'
+
+    with pytest.raises(ValueError) as exc:
+        validate('a' * 60 + 'b')
+    assert 'Timed out' in str(exc.value)
@@ -0,0 +1,100 @@
+import csv
+
+import pytest
+
+from ama_tk.spec import EMPTY_SPEC, Spec, compile_spec, split_spec
+from ama_tk.validator import get_validator
+
+
+def csv_split(source):
+    return tuple(next(csv.reader([source], delimiter='|', quotechar='"'), []))
+
+
+@pytest.mark.parametrize('source', [
+    'a|b',
+    '"a|b"|c',
+    '"a""b"|c',
+    '"ab"c|d',
+    'a"b"|c',
+    '',
+    '|',
+    'a||b',
+    '""',
+    '"a|b',
+    'min=3|"max=|6"',
+    r'a\=b|k=v\=w',
+])
+def test_split_spec_matches_csv(source):
+    assert split_spec(source) == csv_split(source)
+
+
+def test_quoted_delimiter():
+    assert split_spec('"a|b"|c') == ('a|b', 'c')
+
+
+def test_doubled_quote():
+    assert split_spec('"a""b"|c') == ('a"b', 'c')
+
+
+def test_text_after_closing_quote():
+    assert split_spec('"ab"c|d') == ('abc', 'd')
+
+
+def test_escaped_equals_is_positional():
+    spec = compile_spec(r'a\=b|k=v\=w')
+    assert spec.args == (r'a\=b',)
+    assert dict(spec.kwargs) == {'k': r'v\=w'}
+
+
+def test_range_values_are_typed():
+    spec = compile_spec('min=3|max=6.5|exp=1e3|neg=-2|name=abc|ver=1.2.3')
+    assert dict(spec.kwargs) == {
+        'min': 3, 'max': 6.5, 'exp': '1e3', 'neg': '-2', 'name': 'abc',
+        'ver': '1.2.3',
+    }
+    assert type(spec.kwargs['min']) is int
+    assert type(spec.kwargs['max']) is float
+    assert compile_spec('min=a').kwargs['min'] == 'a'
+
+
+def test_other_values_are_strings():
+    with pytest.raises(ValueError) as exc:
+        get_validator('nonempty', 'message=404')('')
+    assert exc.value.args == ('404',)
+
+
+@pytest.mark.parametrize('validator', ['int', 'str'])
+def test_fractional_range_is_rejected(validator):
+    with pytest.raises(ValueError):
+        get_validator(validator, 'min=3.5')
+
+    assert get_validator(validator, 'max=4.0')
+
+
+def test_equal_strings_share_a_spec():
+    source = 'min=3|max=6'
+    assert compile_spec(source) is compile_spec(''.join(source))
+    assert split_spec(source) is split_spec(''.join(source))
+
+
+def test_empty_spec():
+    assert compile_spec(None) is EMPTY_SPEC
+    assert compile_spec('') is EMPTY_SPEC
+    assert not EMPTY_SPEC
+
+
+def test_spec_is_immutable():
+    spec = compile_spec('a|k=1')
+    assert compile_spec(spec) is spec
+
+    with pytest.raises(AttributeError):
+        spec.args = ()
+
+    with pytest.raises(TypeError):
+        spec.kwargs['k'] = 2
+
+
+def test_spec_equality():
+    assert compile_spec('a|min=1') == Spec(None, ['a'], {'min': 1})
+    assert compile_spec('a|k=1') == Spec(None, ['a'], {'k': '1'})
+    assert hash(compile_spec('k=1|j=2')) == hash(compile_spec('j=2|k=1'))